@@ -0,0 +1,158 @@
+# Benchmark da conversão DOCX -> Markdown por fase, em documentos sintéticos de vários tamanhos.
+#
+# Cada medição roda em um processo filho, para que o pico de memória seja só daquela conversão.
+# Uso:
+#   python benchmarks/bench_conversao.py --tamanhos 10 100 1000 10000 --saida resultados.json
+#   python benchmarks/bench_conversao.py --docx manual.docx --comparar resultados_anteriores.json
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+FASES = ["carregar", "imagens", "corpo", "escrita"]
+
+# Função para obter o pico de memória (RSS) do processo atual, em KB (None se não for possível medir)
+def pico_memoria_kb():
+    # No Linux, ru_maxrss herda o pico do processo pai no fork; VmHWM é zerado no exec
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as status:
+            for linha in status:
+                if linha.startswith("VmHWM:"):
+                    return int(linha.split()[1])
+    except OSError:
+        pass
+    try:
+        # O módulo resource só existe nos sistemas Unix
+        import resource
+    except ImportError:
+        pass
+    else:
+        pico_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            pico_kb //= 1024  # No macOS ru_maxrss é dado em bytes
+        return pico_kb
+    try:
+        # No Windows, o pico do working set vem do psutil, se estiver instalado
+        import psutil
+    except ImportError:
+        return None
+    memoria = psutil.Process().memory_info()
+    return getattr(memoria, "peak_wset", memoria.rss) // 1024
+
+# Função executada no processo filho: converte o documento medindo cada fase
+def medir_no_filho(caminho_docx, diretorio_saida, leitura_preguicosa=False, em_fluxo=False):
+    from wordtomd.conversor import converter_docx_para_markdown
+    from wordtomd.perfil import Perfil
+
+    perfil = Perfil()
+    converter_docx_para_markdown(caminho_docx, os.path.join(diretorio_saida, "saida.md"),
+                                 os.path.join(diretorio_saida, "img_saida"), "saida", "Topico", perfil=perfil,
+                                 leitura_preguicosa=leitura_preguicosa, em_fluxo=em_fluxo)
+    tempos = {fase: perfil.fases[fase] for fase in FASES}
+    # A escrita acontece durante o percurso do corpo; o tempo gasto nela é separado do resto
+    tempos["corpo"] -= tempos["escrita"]
+    pico_kb = pico_memoria_kb()
+
+    print(json.dumps({
+        "tempos": tempos,
+        "pico_rss_mb": None if pico_kb is None else round(pico_kb / 1024, 1),
+        "bytes_md": perfil.contagens["bytes_md"],
+        "elementos": perfil.contagens["paragrafos"] + perfil.contagens["tabelas"] + perfil.contagens["imagens"],
+        "contagens": dict(perfil.contagens),
+    }))
+
+# Função para medir um documento em um processo filho
+def medir(caminho_docx, leitura_preguicosa=False, em_fluxo=False):
+    with tempfile.TemporaryDirectory() as diretorio_saida:
+        comando = [sys.executable, os.path.abspath(__file__), "--filho", caminho_docx, diretorio_saida]
+        if leitura_preguicosa:
+            comando.append("--leitura-preguicosa")
+        if em_fluxo:
+            comando.append("--em-fluxo")
+        processo = subprocess.run(comando, capture_output=True, text=True)
+    if processo.returncode != 0:
+        raise RuntimeError(processo.stderr.strip())
+    resultado = json.loads(processo.stdout)
+    total = sum(resultado["tempos"].values())
+    resultado["documento"] = os.path.basename(caminho_docx)
+    resultado["bytes_docx"] = os.path.getsize(caminho_docx)
+    resultado["total"] = total
+    resultado["elementos_por_segundo"] = round(resultado["elementos"] / total) if total else None
+    return resultado
+
+# Função para imprimir uma linha de resultado, com a variação em relação à execução anterior
+def imprimir(resultado, anterior=None):
+    fases = " ".join(f"{fase}={resultado['tempos'][fase]:.3f}s" for fase in FASES)
+    linha = (f"{resultado['documento']:>22} {resultado['elementos']:>7} elem  {fases}  total={resultado['total']:.3f}s  "
+             f"{resultado['elementos_por_segundo'] or 0:>8} elem/s  pico={resultado['pico_rss_mb'] or '?'} MB")
+    if anterior is not None:
+        variacao_tempo = (resultado["total"] / anterior["total"] - 1) * 100 if anterior["total"] else 0
+        if resultado["pico_rss_mb"] is None or anterior.get("pico_rss_mb") is None:
+            linha += f"  [tempo {variacao_tempo:+.0f}%]"
+        else:
+            variacao_memoria = resultado["pico_rss_mb"] - anterior["pico_rss_mb"]
+            linha += f"  [tempo {variacao_tempo:+.0f}%, memória {variacao_memoria:+.1f} MB]"
+    print(linha)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da conversão DOCX -> Markdown por fase.")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[10, 100, 1000, 10000],
+                        help="Quantidades de elementos dos documentos sintéticos (ex.: 10 100 1000 10000 100000).")
+    parser.add_argument("--docx", nargs="+", default=[], help="Documentos reais a medir além dos sintéticos.")
+    parser.add_argument("--corpus", help="Diretório para guardar/reutilizar os documentos sintéticos.")
+    parser.add_argument("--semente", type=int, default=0, help="Semente do gerador de documentos.")
+    parser.add_argument("--saida", help="Arquivo JSON onde gravar os resultados.")
+    parser.add_argument("--comparar", help="Arquivo JSON de uma execução anterior para comparação.")
+    parser.add_argument("--leitura-preguicosa", action="store_true", help="Converte com leitura_preguicosa=True (mídias ficam no disco).")
+    parser.add_argument("--em-fluxo", action="store_true", help="Converte com em_fluxo=True (document.xml lido em fluxo).")
+    parser.add_argument("--filho", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.filho:
+        medir_no_filho(*args.filho, leitura_preguicosa=args.leitura_preguicosa, em_fluxo=args.em_fluxo)
+        return
+
+    from benchmarks.gerador import gerar_documento
+    from wordtomd import __version__
+
+    anteriores = {}
+    if args.comparar:
+        with open(args.comparar, "r", encoding="utf-8") as arquivo:
+            anteriores = {resultado["documento"]: resultado for resultado in json.load(arquivo)["resultados"]}
+
+    with tempfile.TemporaryDirectory() as diretorio_temporario:
+        corpus = args.corpus or diretorio_temporario
+        os.makedirs(corpus, exist_ok=True)
+        documentos = []
+        for tamanho in args.tamanhos:
+            caminho = os.path.join(corpus, f"sintetico_{tamanho}_s{args.semente}.docx")
+            if not os.path.exists(caminho):
+                gerar_documento(caminho, tamanho, args.semente)
+            documentos.append(caminho)
+        documentos.extend(args.docx)
+
+        resultados = []
+        for caminho in documentos:
+            resultado = medir(caminho, args.leitura_preguicosa, args.em_fluxo)
+            imprimir(resultado, anteriores.get(resultado["documento"]))
+            resultados.append(resultado)
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            json.dump({
+                "versao_conversor": __version__,
+                "python": platform.python_version(),
+                "plataforma": platform.platform(),
+                "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "resultados": resultados,
+            }, arquivo, ensure_ascii=False, indent=2)
+
+if __name__ == "__main__":
+    main()
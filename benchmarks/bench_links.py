@@ -0,0 +1,46 @@
+# Microbenchmark de formatar_link em textos com muitos links e sem links.
+#
+# Uso: python benchmarks/bench_links.py [--textos N]
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from wordtomd.conversor import formatar_link
+
+DOMINIOS = ["www.exemplo.com.br", "docs.github.com", "github.io", "intranet.empresa.com", "www.amazon.com.br"]
+
+# Função para gerar textos com a densidade de links desejada
+def gerar_textos(quantidade, links_por_texto):
+    textos = []
+    for i in range(quantidade):
+        partes = [f"Parágrafo {i} com texto comum"]
+        for j in range(links_por_texto):
+            partes.append(f"https://{DOMINIOS[(i + j) % len(DOMINIOS)]}/pagina/{i}/{j}?ref=doc")
+        textos.append(" ".join(partes))
+    return textos
+
+# Função para medir o tempo de formatar_link sobre uma lista de textos
+def medir(textos):
+    inicio = time.perf_counter()
+    for texto in textos:
+        formatar_link(texto)
+    return time.perf_counter() - inicio
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmark de formatar_link.")
+    parser.add_argument("--textos", type=int, default=20000, help="Quantidade de textos por cenário.")
+    args = parser.parse_args()
+
+    # Aquecimento: carrega a lista de sufixos públicos uma única vez
+    formatar_link("https://www.exemplo.com.br")
+
+    for nome, links_por_texto in [("sem links", 0), ("1 link", 1), ("5 links", 5)]:
+        textos = gerar_textos(args.textos, links_por_texto)
+        duracao = medir(textos)
+        print(f"{nome:>10}: {args.textos} textos em {duracao:.3f}s ({args.textos / duracao:,.0f} textos/s)")
+
+if __name__ == "__main__":
+    main()
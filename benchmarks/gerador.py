@@ -0,0 +1,108 @@
+# Gerador de documentos DOCX sintéticos para os benchmarks.
+#
+# Uso: python benchmarks/gerador.py saida.docx --elementos 10000 [--semente 0]
+import argparse
+import io
+import random
+
+from docx import Document
+from docx.oxml import OxmlElement
+from docx.oxml.table import CT_Tbl
+from docx.shared import Inches
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+# Proporção de cada tipo de elemento gerado (o restante são parágrafos de texto)
+PROPORCAO_TITULOS = 0.05
+PROPORCAO_TABELAS = 0.02
+PROPORCAO_IMAGENS = 0.03
+PROPORCAO_LINKS = 0.20
+
+# Quantidade de imagens distintas; as demais repetem estas, como capturas de tela coladas várias vezes
+IMAGENS_DISTINTAS = 20
+
+DOMINIOS = ["www.exemplo.com.br", "docs.github.com", "intranet.empresa.com", "www.amazon.com.br", "pages.github.io"]
+PALAVRAS = ["documentação", "configuração", "serviço", "ambiente", "usuário", "processo", "arquivo", "sistema", "acesso", "dados"]
+
+# Função para gerar os bytes de uma imagem PNG pequena e distinta
+def gerar_png(indice):
+    from PIL import Image
+
+    fluxo = io.BytesIO()
+    Image.new("RGB", (64, 64), ((indice * 37) % 256, (indice * 91) % 256, (indice * 53) % 256)).save(fluxo, "PNG")
+    return fluxo.getvalue()
+
+# Função para gerar um documento sintético com o número de elementos desejado.
+def gerar_documento(caminho, elementos, semente=0):
+    """
+    Função para gerar um documento sintético com parágrafos formatados,
+    títulos, tabelas, imagens e links.
+
+    Args:
+        caminho (str): Caminho do arquivo DOCX a ser gerado.
+        elementos (int): Quantidade de elementos do corpo (parágrafos, títulos, tabelas e imagens).
+        semente (int, opcional): Semente do gerador aleatório, para documentos reproduzíveis.
+
+    Returns:
+        dict: Quantidade gerada de cada tipo de elemento.
+    """
+    aleatorio = random.Random(semente)
+    documento = Document()
+    sect_pr = documento.element.body.sectPr
+    imagens = [gerar_png(indice) for indice in range(IMAGENS_DISTINTAS)]
+    contagem = {"paragrafos": 0, "titulos": 0, "tabelas": 0, "imagens": 0, "links": 0}
+
+    # documento.add_paragraph/add_table procuram o w:sectPr a cada chamada (custo
+    # quadrático); aqui cada elemento é inserido diretamente antes dele
+    def novo_paragrafo(estilo=None):
+        elemento = OxmlElement("w:p")
+        sect_pr.addprevious(elemento)
+        paragrafo = Paragraph(elemento, documento._body)
+        if estilo is not None:
+            paragrafo.style = estilo
+        return paragrafo
+
+    def frase(tamanho):
+        return " ".join(aleatorio.choice(PALAVRAS) for _ in range(tamanho))
+
+    for indice in range(elementos):
+        sorteio = aleatorio.random()
+        if sorteio < PROPORCAO_TITULOS:
+            novo_paragrafo(f"Heading {aleatorio.randint(1, 3)}").add_run(frase(3))
+            contagem["titulos"] += 1
+        elif sorteio < PROPORCAO_TITULOS + PROPORCAO_TABELAS:
+            linhas, colunas = aleatorio.randint(2, 6), aleatorio.randint(2, 4)
+            elemento = CT_Tbl.new_tbl(linhas, colunas, Inches(6))
+            sect_pr.addprevious(elemento)
+            tabela = Table(elemento, documento._body)
+            for celula in elemento.iter_tcs():
+                celula.clear_content()
+                paragrafo = Paragraph(celula.add_p(), tabela)
+                paragrafo.add_run(frase(2)).bold = aleatorio.random() < 0.2
+            contagem["tabelas"] += 1
+        elif sorteio < PROPORCAO_TITULOS + PROPORCAO_TABELAS + PROPORCAO_IMAGENS:
+            imagem = imagens[aleatorio.randrange(IMAGENS_DISTINTAS)]
+            novo_paragrafo().add_run().add_picture(io.BytesIO(imagem), width=Inches(1))
+            contagem["imagens"] += 1
+        else:
+            paragrafo = novo_paragrafo()
+            paragrafo.add_run(frase(aleatorio.randint(4, 12)) + " ")
+            paragrafo.add_run(frase(2)).bold = True
+            paragrafo.add_run(" " + frase(3) + " ").italic = aleatorio.random() < 0.3
+            if aleatorio.random() < PROPORCAO_LINKS:
+                paragrafo.add_run(f"https://{aleatorio.choice(DOMINIOS)}/pagina/{indice}")
+                contagem["links"] += 1
+            contagem["paragrafos"] += 1
+    documento.save(caminho)
+    return contagem
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera um documento DOCX sintético.")
+    parser.add_argument("saida", help="Arquivo .docx a ser gerado.")
+    parser.add_argument("--elementos", type=int, default=1000, help="Quantidade de elementos do corpo.")
+    parser.add_argument("--semente", type=int, default=0, help="Semente do gerador aleatório.")
+    args = parser.parse_args()
+    print(gerar_documento(args.saida, args.elementos, args.semente))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import os
+import re
+import pytest
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.text.paragraph import Paragraph
+from wordtomd.conversor import converter_docx_para_markdown, indexar_imagens, obter_texto_paragrafo
+from wordtomd.texto import EstilosDocumento, extrair_texto_paragrafo
+
+DIRETORIO_TESTES = os.path.dirname(os.path.abspath(__file__))
+DIRETORIO_ESPERADO = os.path.join(DIRETORIO_TESTES, "esperado")
+DOCUMENTOS = ["Documentacao", "Teste", "exemplo"]
+
+# Modos de leitura do DOCX, que devem gerar o mesmo Markdown
+MODOS = {
+    "padrao": {},
+    "leitura_preguicosa": {"leitura_preguicosa": True},
+    "em_fluxo": {"em_fluxo": True},
+}
+
+# O separador dos links das imagens depende do sistema (".\img_x/x.png" ou "img_x\x.png")
+PADRAO_LINK_IMAGEM = re.compile(r"\]\([^)]*?([^/\\)]+\.\w+)\)")
+
+# Estilos mínimos: um estilo de caractere negrito e outro, baseado nele, também itálico
+ESTILOS = f"""
+<w:styles {nsdecls("w")}>
+  <w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/></w:style>
+  <w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/><w:rPr><w:b/></w:rPr></w:style>
+  <w:style w:type="character" w:styleId="Forte"><w:name w:val="Forte"/><w:rPr><w:b/></w:rPr></w:style>
+  <w:style w:type="character" w:styleId="ForteItalico"><w:basedOn w:val="Forte"/><w:rPr><w:i/></w:rPr></w:style>
+</w:styles>
+"""
+
+# Função para converter um documento de tests/ e ler o Markdown gerado (cabeçalho sem data)
+def converter(diretorio, nome, **opcoes):
+    caminho_md = os.path.join(diretorio, f"{nome}.md")
+    converter_docx_para_markdown(os.path.join(DIRETORIO_TESTES, f"{nome}.docx"), caminho_md, f"img_{nome}", nome, "Sub-Topico", **opcoes)
+    with open(caminho_md, "r", encoding="utf-8") as arquivo_md:
+        return PADRAO_LINK_IMAGEM.sub(r"](\1)", arquivo_md.read())
+
+# Namespaces usados pelas imagens (DrawingML, SVG, VML e compatibilidade de marcação)
+NAMESPACES_DESENHO = (
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture" '
+    'xmlns:asvg="http://schemas.microsoft.com/office/drawing/2016/SVG/main" '
+    'xmlns:v="urn:schemas-microsoft-com:vml" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+)
+
+# Função para montar um run com uma imagem; se svg for informado, ela tem também a versão SVG
+def run_imagem(rId, svg=None):
+    extensoes = "" if svg is None else f'<a:extLst><a:ext><asvg:svgBlip r:embed="{svg}"/></a:ext></a:extLst>'
+    return (f'<w:r><w:drawing><pic:pic><pic:blipFill><a:blip r:embed="{rId}">{extensoes}</a:blip>'
+            "</pic:blipFill></pic:pic></w:drawing></w:r>")
+
+# Função para montar um parágrafo a partir dos seus runs em XML
+def paragrafo(runs, estilo=None):
+    propriedades = "" if estilo is None else f'<w:pPr><w:pStyle w:val="{estilo}"/></w:pPr>'
+    return parse_xml(f"<w:p {nsdecls('w', 'r')} {NAMESPACES_DESENHO}>{propriedades}{runs}</w:p>")
+
+# Função para montar um run com as propriedades e o texto informados
+def run(texto, propriedades=""):
+    return f'<w:r><w:rPr>{propriedades}</w:rPr><w:t xml:space="preserve">{texto}</w:t></w:r>'
+
+@pytest.fixture
+def estilos():
+    return EstilosDocumento(parse_xml(ESTILOS))
+
+@pytest.mark.parametrize("modo", MODOS)
+@pytest.mark.parametrize("nome", DOCUMENTOS)
+def test_documentos_de_exemplo(tmp_path, monkeypatch, nome, modo):
+    monkeypatch.chdir(tmp_path)
+    with open(os.path.join(DIRETORIO_ESPERADO, f"{nome}.md"), "r", encoding="utf-8") as arquivo_esperado:
+        esperado = arquivo_esperado.read()
+    assert converter(".", nome, **MODOS[modo]) == esperado
+
+def test_runs_vizinhos_com_a_mesma_formatacao_sao_unidos(estilos):
+    elemento_p = paragrafo(run("Texto ", "<w:b/>") + run("negrito", "<w:b/>") + run(" e ") + run("fim", "<w:b/><w:i/>"))
+    assert extrair_texto_paragrafo(elemento_p, estilos) == "**Texto negrito** e ___fim___"
+
+def test_run_so_com_espacos_nao_separa_o_grupo(estilos):
+    elemento_p = paragrafo(run("a", "<w:i/>") + run("  ") + run("b", "<w:i/>") + run(" ") + run("c"))
+    assert extrair_texto_paragrafo(elemento_p, estilos) == "_a  b_ c"
+
+def test_formatacao_herdada_do_estilo_de_caractere(estilos):
+    elemento_p = paragrafo(run("forte", '<w:rStyle w:val="Forte"/>') + run(" ") + run("ambos", '<w:rStyle w:val="ForteItalico"/>')
+                           + run(" ") + run("desligado", '<w:rStyle w:val="Forte"/><w:b w:val="0"/>'))
+    assert extrair_texto_paragrafo(elemento_p, estilos) == "**forte** ___ambos___ desligado"
+
+def test_formatacao_do_estilo_de_paragrafo_nao_e_aplicada(estilos):
+    elemento_p = paragrafo(run("Título"), estilo="Heading1")
+    assert extrair_texto_paragrafo(elemento_p, estilos) == "Título"
+    assert estilos.nome_paragrafo(elemento_p) == "Heading 1"
+    assert estilos.nome_paragrafo(paragrafo(run("x"))) == "Normal"
+
+def test_quebras_e_tabulacoes_como_no_python_docx(estilos):
+    runs = ('<w:r><w:t>a</w:t><w:tab/><w:t>b</w:t><w:br/><w:t>c</w:t><w:br w:type="page"/>'
+            '<w:noBreakHyphen/><w:cr/></w:r>')
+    assert extrair_texto_paragrafo(paragrafo(runs), estilos) == "a\tb\nc-\n"
+
+def test_equivalente_ao_motor_anterior_sem_runs_para_unir(estilos):
+    # Sem vizinhos com a mesma formatação, o resultado é o mesmo de obter_texto_paragrafo
+    formatos = ["", "<w:b/>", "<w:i/>", "<w:b/><w:i/>", '<w:b w:val="false"/>', '<w:i w:val="0"/><w:b/>']
+    runs = "".join(run(f"parte{indice}", formatos[indice % len(formatos)]) for indice in range(24))
+    elemento_p = paragrafo(runs)
+    assert extrair_texto_paragrafo(elemento_p, estilos) == obter_texto_paragrafo(Paragraph(elemento_p, None))
+
+def test_imagem_svg_e_fallback_sao_indexados_uma_vez():
+    alternativa = ("<w:r><mc:AlternateContent><mc:Choice>" + run_imagem("rId7")[5:-6] + "</mc:Choice>"
+                   '<mc:Fallback><w:pict><v:shape><v:imagedata r:id="rId8"/></v:shape></w:pict></mc:Fallback>'
+                   "</mc:AlternateContent></w:r>")
+    elemento_p = paragrafo(run_imagem("rId5", svg="rId6") + alternativa)
+    assert indexar_imagens(elemento_p) == {elemento_p: ["rId5", "rId7"]}
+
+def test_mesma_imagem_repetida_no_paragrafo_aparece_duas_vezes():
+    elemento_p = paragrafo(run_imagem("rId5") + run_imagem("rId5"))
+    assert indexar_imagens(elemento_p) == {elemento_p: ["rId5", "rId5"]}
+
+def test_sem_gravar_imagens_o_markdown_e_o_mesmo(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with open(os.path.join(DIRETORIO_ESPERADO, "Documentacao.md"), "r", encoding="utf-8") as arquivo_esperado:
+        esperado = arquivo_esperado.read()
+    assert converter(".", "Documentacao", gravar_imagens=False) == esperado
+    assert not os.path.exists("img_Documentacao")
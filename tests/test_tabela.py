@@ -0,0 +1,103 @@
+import pytest
+from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from wordtomd.conversor import converter_docx_para_markdown
+from wordtomd.tabela import escapar_celula, linhas_tabela
+
+# Função para obter o texto de um parágrafo sem formatação (basta para testar a montagem das linhas)
+def texto_simples(elemento_p):
+    return "".join(elemento_t.text or "" for elemento_t in elemento_p.iter(qn("w:t")))
+
+# Função para montar uma tabela a partir das suas linhas em XML
+def tabela(linhas, colunas=None):
+    grade = "" if colunas is None else "<w:tblGrid>" + "<w:gridCol/>" * colunas + "</w:tblGrid>"
+    return parse_xml(f"<w:tbl {nsdecls('w')}>{grade}{linhas}</w:tbl>")
+
+# Função para montar uma célula com um parágrafo por texto
+def celula(*textos, propriedades=""):
+    paragrafos = "".join(f"<w:p><w:r><w:t>{texto}</w:t></w:r></w:p>" for texto in textos) or "<w:p/>"
+    return f"<w:tc><w:tcPr>{propriedades}</w:tcPr>{paragrafos}</w:tc>"
+
+@pytest.mark.parametrize("opcoes", [{}, {"leitura_preguicosa": True}, {"em_fluxo": True}], ids=["padrao", "leitura_preguicosa", "em_fluxo"])
+def test_tabela_com_celulas_mescladas_e_varios_paragrafos(tmp_path, monkeypatch, opcoes):
+    monkeypatch.chdir(tmp_path)
+    documento = Document()
+    documento.add_paragraph("Antes")
+    tabela_docx = documento.add_table(rows=4, cols=3)
+    cabecalho = tabela_docx.rows[0].cells
+    cabecalho[0].paragraphs[0].add_run("Nome").bold = True
+    cabecalho[1].text = "Valor | bruto"
+    cabecalho[2].text = "Obs"
+    # Mescla horizontal (w:gridSpan)
+    tabela_docx.cell(1, 0).merge(tabela_docx.cell(1, 1)).text = "Mesclada"
+    tabela_docx.cell(1, 2).text = "x"
+    # Vários parágrafos em uma célula (o vazio é ignorado)
+    celula_docx = tabela_docx.cell(2, 0)
+    celula_docx.text = "Linha 1"
+    celula_docx.add_paragraph("")
+    celula_docx.add_paragraph("Linha 2")
+    tabela_docx.cell(2, 1).text = "a|b"
+    # Mescla vertical (w:vMerge)
+    tabela_docx.cell(2, 2).merge(tabela_docx.cell(3, 2)).text = "Vertical"
+    tabela_docx.cell(3, 0).text = "fim"
+    documento.add_paragraph("Depois")
+    documento.save("tabela.docx")
+
+    converter_docx_para_markdown("tabela.docx", "tabela.md", "img_tabela", "tabela", "Sub-Topico", **opcoes)
+    with open("tabela.md", "r", encoding="utf-8") as arquivo_md:
+        linhas = [linha for linha in arquivo_md.read().splitlines() if linha.startswith("|")]
+    assert linhas == [
+        "| **Nome** | Valor \\| bruto | Obs |",
+        "| --- | --- | --- |",
+        "| Mesclada |  | x |",
+        "| Linha 1<br>Linha 2 | a\\|b | Vertical |",
+        "| fim |  |  |",
+    ]
+
+def test_colunas_puladas_e_linhas_completadas_ate_a_grade():
+    linhas = (
+        "<w:tr>" + celula("a") + celula("b") + celula("c") + "</w:tr>"
+        '<w:tr><w:trPr><w:gridBefore w:val="1"/><w:gridAfter w:val="1"/></w:trPr>' + celula("meio") + "</w:tr>"
+        "<w:tr>" + celula("curta") + "</w:tr>"
+    )
+    assert list(linhas_tabela(tabela(linhas, colunas=3), texto_simples)) == [
+        ["a", "b", "c"],
+        ["", "meio", ""],
+        ["curta", "", ""],
+    ]
+
+def test_tabela_sem_grade_usa_a_primeira_linha():
+    linhas = "<w:tr>" + celula("a") + celula("b", propriedades='<w:gridSpan w:val="2"/>') + "</w:tr><w:tr>" + celula("c") + "</w:tr>"
+    assert list(linhas_tabela(tabela(linhas), texto_simples)) == [["a", "b", ""], ["c", "", ""]]
+
+def test_mescla_vertical_so_repete_o_texto_na_primeira_celula():
+    linhas = (
+        "<w:tr>" + celula("topo", propriedades='<w:vMerge w:val="restart"/>') + "</w:tr>"
+        "<w:tr>" + celula("ignorado", propriedades="<w:vMerge/>") + "</w:tr>"
+        "<w:tr>" + celula("ignorado", propriedades='<w:vMerge w:val="continue"/>') + "</w:tr>"
+    )
+    assert list(linhas_tabela(tabela(linhas, colunas=1), texto_simples)) == [["topo"], [""], [""]]
+
+def test_paragrafos_de_tabela_aninhada_entram_na_celula():
+    aninhada = "<w:tbl><w:tr>" + celula("x", "y") + "</w:tr></w:tbl>"
+    linhas = "<w:tr><w:tc>" + "<w:p><w:r><w:t>fora</w:t></w:r></w:p>" + aninhada + "<w:p/></w:tc></w:tr>"
+    assert list(linhas_tabela(tabela(linhas, colunas=1), texto_simples)) == [["fora<br>x<br>y"]]
+
+def test_escapar_celula():
+    assert escapar_celula("a | b\nc") == "a \\| b<br>c"
+
+def test_tabela_sem_linhas_e_ignorada(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    documento = Document()
+    documento.add_paragraph("Antes")
+    tabela_docx = documento.add_table(rows=1, cols=1)
+    tabela_docx._tbl.remove(tabela_docx.rows[0]._tr)
+    documento.add_paragraph("Depois")
+    documento.save("vazia.docx")
+
+    converter_docx_para_markdown("vazia.docx", "vazia.md", "img_vazia", "vazia", "Sub-Topico")
+    with open("vazia.md", "r", encoding="utf-8") as arquivo_md:
+        conteudo = arquivo_md.read()
+    assert "|" not in conteudo
+    assert conteudo.index("Antes") < conteudo.index("Depois")
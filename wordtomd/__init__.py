@@ -0,0 +1,15 @@
+# Núcleo de conversão DOCX -> Markdown, importável sem carregar a interface gráfica.
+
+# Versão do conversor; mudá-la invalida os manifestos da conversão incremental e o cache de conversões
+__version__ = "1.4.0"
+
+from wordtomd.conversor import (
+    converter_docx_para_markdown,
+    exportar_imagem,
+    formatar_link,
+    gerar_cabecalho,
+    indexar_imagens,
+    obter_texto_paragrafo,
+    salvar_imagem,
+)
+from wordtomd.texto import EstilosDocumento, extrair_texto_paragrafo
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from wordtomd import __version__
+
+# Nome do banco do cache dentro do diretório de cache
+NOME_BANCO = "conversoes.sqlite3"
+
+# Tamanho máximo padrão do cache; acima dele as entradas menos usadas são removidas
+TAMANHO_MAXIMO_PADRAO = 256 * 1024 * 1024
+
+# Função para calcular o hash SHA-256 do conteúdo de um arquivo.
+def calcular_hash(caminho):
+    """
+    Função para calcular o hash SHA-256 do conteúdo de um arquivo.
+
+    Args:
+        caminho (str): Caminho do arquivo.
+
+    Returns:
+        str: Hash em hexadecimal.
+    """
+    hash_arquivo = hashlib.sha256()
+    with open(caminho, "rb") as arquivo:
+        for bloco in iter(lambda: arquivo.read(1024 * 1024), b""):
+            hash_arquivo.update(bloco)
+    return hash_arquivo.hexdigest()
+
+# Função para obter o diretório de cache padrão do usuário.
+def diretorio_cache_padrao():
+    """
+    Função para obter o diretório de cache padrão do usuário
+    (%LOCALAPPDATA%\\wordtomd no Windows, $XDG_CACHE_HOME/wordtomd ou ~/.cache/wordtomd nos demais).
+
+    Returns:
+        str: Caminho do diretório de cache.
+    """
+    base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "wordtomd")
+
+# Classe que copia para a memória tudo o que é escrito em um fluxo de texto
+class FluxoCopia:
+    """
+    Fluxo de texto que repassa as escritas para outro fluxo e guarda uma cópia
+    delas, usada para gravar o corpo do Markdown no cache. Quando a cópia passa
+    do limite, ela é descartada e o restante não é mais copiado: um corpo
+    maior que o cache não seria guardado, e a conversão continua sem acumular
+    o documento na memória.
+
+    Args:
+        fluxo (io.TextIOBase): Fluxo de texto de destino.
+        limite (int, opcional): Número máximo de caracteres copiados. Sem limite, tudo é copiado.
+    """
+    def __init__(self, fluxo, limite=None):
+        self.fluxo = fluxo
+        self.limite = limite
+        self.partes = []
+        self.tamanho = 0
+        self.excedeu = False
+
+    def write(self, texto):
+        self.fluxo.write(texto)
+        if self.excedeu:
+            return
+        self.tamanho += len(texto)
+        if self.limite is not None and self.tamanho > self.limite:
+            self.excedeu = True
+            self.partes.clear()
+            return
+        self.partes.append(texto)
+
+    def flush(self):
+        self.fluxo.flush()
+
+    # Função para obter o texto copiado (None se passou do limite)
+    def texto(self):
+        if self.excedeu:
+            return None
+        return "".join(self.partes)
+
+# Classe do cache persistente de conversões
+class CacheConversao:
+    """
+    Cache persistente (SQLite) do corpo Markdown das conversões, com remoção
+    das entradas menos usadas recentemente (LRU) quando o tamanho total passa
+    do limite. Só o corpo é guardado: o cabeçalho depende de datetime.now()
+    e é gerado de novo a cada conversão.
+
+    Falhas do banco (arquivo corrompido, bloqueado por outro processo...)
+    nunca interrompem a conversão; o cache apenas deixa de ser usado.
+
+    Args:
+        diretorio (str, opcional): Diretório do banco. Padrão: diretorio_cache_padrao().
+        tamanho_maximo (int, opcional): Tamanho máximo, em bytes, dos corpos guardados.
+    """
+    def __init__(self, diretorio=None, tamanho_maximo=TAMANHO_MAXIMO_PADRAO):
+        self.diretorio = diretorio or diretorio_cache_padrao()
+        self.caminho = os.path.join(self.diretorio, NOME_BANCO)
+        self.tamanho_maximo = tamanho_maximo
+        self.tabela_criada = False
+
+    # Função para abrir uma conexão com o banco, criando-o se preciso
+    def conectar(self):
+        # Uma conexão por operação permite usar o cache em threads e processos diferentes
+        if not self.tabela_criada:
+            os.makedirs(self.diretorio, exist_ok=True)
+        conexao = sqlite3.connect(self.caminho, timeout=30)
+        if not self.tabela_criada:
+            with conexao:
+                conexao.execute("CREATE TABLE IF NOT EXISTS conversoes ("
+                                "chave TEXT PRIMARY KEY, corpo TEXT NOT NULL, imagens TEXT NOT NULL, "
+                                "tamanho INTEGER NOT NULL, acesso REAL NOT NULL)")
+            self.tabela_criada = True
+        return conexao
+
+    # Função para montar a chave de uma conversão
+    def chave(self, hash_docx, tipo_cabecalho, nome_arquivo, caminho_md_saida, diretorio_imagem):
+        """
+        Função para montar a chave de uma conversão. Além do conteúdo do DOCX,
+        da versão do conversor e do tipo de cabeçalho, a chave inclui os caminhos
+        de saída, dos quais dependem os links das imagens no Markdown.
+
+        Args:
+            hash_docx (str): Hash SHA-256 do conteúdo do DOCX.
+            tipo_cabecalho (str): Tipo de cabeçalho ("Topico" ou "Sub-Topico").
+            nome_arquivo (str): Nome do documento, usado como prefixo das imagens.
+            caminho_md_saida (str): Caminho do arquivo Markdown.
+            diretorio_imagem (str): Diretório das imagens.
+
+        Returns:
+            str: Chave da conversão.
+        """
+        partes = [hash_docx, __version__, tipo_cabecalho, nome_arquivo, caminho_md_saida, diretorio_imagem, os.getcwd()]
+        return hashlib.sha256(json.dumps(partes).encode("utf-8")).hexdigest()
+
+    # Função para obter o corpo guardado de uma conversão
+    def obter(self, chave):
+        """
+        Função para obter o corpo Markdown guardado de uma conversão.
+
+        Args:
+            chave (str): Chave retornada por chave().
+
+        Returns:
+            tuple | None: Corpo Markdown e lista dos nomes das imagens exportadas,
+            ou None se a conversão não estiver no cache.
+        """
+        try:
+            with closing(self.conectar()) as conexao, conexao:
+                linha = conexao.execute("SELECT corpo, imagens FROM conversoes WHERE chave = ?", (chave,)).fetchone()
+                if linha is None:
+                    return None
+                conexao.execute("UPDATE conversoes SET acesso = ? WHERE chave = ?", (time.time(), chave))
+        except sqlite3.Error:
+            return None
+        return linha[0], json.loads(linha[1])
+
+    # Função para guardar o corpo de uma conversão, removendo as entradas menos usadas se preciso
+    def guardar(self, chave, corpo, imagens):
+        """
+        Função para guardar o corpo Markdown de uma conversão. Se o total
+        passar do tamanho máximo, as entradas acessadas há mais tempo são removidas.
+
+        Args:
+            chave (str): Chave retornada por chave().
+            corpo (str): Corpo Markdown (tudo o que vem depois do cabeçalho).
+            imagens (list): Nomes dos arquivos de imagem exportados pela conversão.
+        """
+        tamanho = len(corpo.encode("utf-8"))
+        if tamanho > self.tamanho_maximo:
+            return
+        try:
+            with closing(self.conectar()) as conexao, conexao:
+                conexao.execute("INSERT OR REPLACE INTO conversoes (chave, corpo, imagens, tamanho, acesso) VALUES (?, ?, ?, ?, ?)",
+                                (chave, corpo, json.dumps(imagens), tamanho, time.time()))
+                total = conexao.execute("SELECT COALESCE(SUM(tamanho), 0) FROM conversoes").fetchone()[0]
+                if total > self.tamanho_maximo:
+                    for chave_antiga, tamanho_antigo in conexao.execute("SELECT chave, tamanho FROM conversoes ORDER BY acesso").fetchall():
+                        if total <= self.tamanho_maximo:
+                            break
+                        conexao.execute("DELETE FROM conversoes WHERE chave = ?", (chave_antiga,))
+                        total -= tamanho_antigo
+        except sqlite3.Error:
+            pass
+
+    # Função para apagar todas as entradas do cache
+    def limpar(self):
+        try:
+            with closing(self.conectar()) as conexao, conexao:
+                conexao.execute("DELETE FROM conversoes")
+        except sqlite3.Error:
+            pass
@@ -0,0 +1,186 @@
+import argparse
+import os
+import sys
+
+TIPOS_CABECALHO = ["Topico", "Sub-Topico"]
+
+# Função para converter um arquivo DOCX pela linha de comando
+def comando_convert(args):
+    """
+    Função para converter um arquivo DOCX pela linha de comando.
+
+    Args:
+        args (argparse.Namespace): Argumentos com entrada, saída, tipo de cabeçalho e opções de perfil.
+
+    Returns:
+        int: Código de saída do processo.
+    """
+    from wordtomd.lote import converter_arquivo
+
+    os.makedirs(args.saida, exist_ok=True)
+    resultado = converter_arquivo(args.entrada, args.saida, args.header, args.profile, args.pstats,
+                                  fluxo_saida=sys.stdout if args.stdout else None, diretorio_cache=diretorio_cache(args),
+                                  leitura_preguicosa=args.lazy, em_fluxo=args.stream)
+    if resultado.perfil is not None:
+        print(resultado.perfil.relatorio(resultado.caminho_docx), file=sys.stderr)
+    if resultado.erro is not None:
+        print(f"Erro ao converter {args.entrada}: {resultado.erro}", file=sys.stderr)
+        return 1
+    if not args.stdout:
+        print(resultado.caminho_md)
+    return 0
+
+# Função para converter todos os arquivos DOCX de um diretório pela linha de comando
+def comando_batch(args):
+    """
+    Função para converter todos os arquivos DOCX de um diretório pela linha de comando.
+
+    Args:
+        args (argparse.Namespace): Argumentos com diretórios, tipo de cabeçalho, número de processos e opções de perfil.
+
+    Returns:
+        int: Código de saída do processo (1 se algum arquivo falhar).
+    """
+    from wordtomd.lote import converter_em_lote
+    from wordtomd.perfil import Perfil
+
+    perfil_lote = Perfil()
+
+    def ao_progredir(resultado, concluidos, total):
+        if resultado.ignorado:
+            return
+        situacao = "OK" if resultado.erro is None else f"ERRO: {resultado.erro}"
+        print(f"[{concluidos}/{total}] {resultado.caminho_docx} {situacao}", file=sys.stderr)
+        if resultado.perfil is not None:
+            print(resultado.perfil.relatorio(), file=sys.stderr)
+            perfil_lote.somar(resultado.perfil)
+
+    resultados = converter_em_lote(args.entrada, args.saida, args.header, jobs=args.jobs, ao_progredir=ao_progredir, incremental=args.incremental,
+                                   perfilar=args.profile, diretorio_pstats=args.pstats, diretorio_cache=diretorio_cache(args),
+                                   leitura_preguicosa=args.lazy, em_fluxo=args.stream)
+    falhas = [resultado for resultado in resultados if resultado.erro is not None]
+    ignorados = [resultado for resultado in resultados if resultado.ignorado]
+    if args.profile:
+        # Com vários processos, os tempos somados ultrapassam o tempo de relógio do lote
+        print(perfil_lote.relatorio("Total do lote (soma dos documentos):"), file=sys.stderr)
+    print(f"{len(resultados) - len(falhas) - len(ignorados)}/{len(resultados)} arquivos convertidos, {len(ignorados)} inalterados", file=sys.stderr)
+    return 1 if falhas else 0
+
+# Função para observar um diretório e converter os DOCX salvos nele pela linha de comando
+def comando_watch(args):
+    """
+    Função para observar um diretório e converter continuamente os arquivos DOCX
+    salvos nele, até Ctrl+C ou SIGTERM. O registro (vazão, latência, erros) vai para stderr.
+
+    Args:
+        args (argparse.Namespace): Argumentos com diretórios, tipo de cabeçalho e opções de observação.
+
+    Returns:
+        int: Código de saída do processo.
+    """
+    import logging
+    import signal
+    import threading
+    from wordtomd.observador import ObservadorDiretorio
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format="%(asctime)s %(levelname)s %(message)s", stream=sys.stderr)
+    observador = ObservadorDiretorio(args.entrada, args.saida, args.header, intervalo=args.interval, espera=args.debounce, jobs=args.jobs,
+                                     diretorio_cache=diretorio_cache(args), leitura_preguicosa=args.lazy, em_fluxo=args.stream)
+    # SIGTERM (ex.: systemd, docker stop) encerra a observação como o Ctrl+C
+    parar = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: parar.set())
+    observador.executar(parar)
+    return 0
+
+# Função para abrir a interface gráfica
+def comando_gui(args):
+    # A interface gráfica (tkinter, customtkinter, PIL) só é carregada aqui
+    from wordtomd.gui import main as iniciar_gui
+
+    iniciar_gui()
+    return 0
+
+# Função para validar um número inteiro maior que zero (ex.: --jobs)
+def inteiro_positivo(valor):
+    try:
+        numero = int(valor)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"valor inteiro inválido: {valor!r}")
+    if numero < 1:
+        raise argparse.ArgumentTypeError(f"deve ser maior que zero: {valor!r}")
+    return numero
+
+# Função para adicionar as opções de perfil a um subcomando
+def adicionar_opcoes_perfil(parser):
+    parser.add_argument("--profile", action="store_true", help="Mostra em stderr o tempo de cada fase e tipo de elemento e os contadores de cada documento.")
+    parser.add_argument("--pstats", metavar="DIR", help="Grava a saída do cProfile de cada documento em DIR/<nome>.prof (legível com pstats).")
+
+# Função para adicionar as opções de leitura do DOCX a um subcomando
+def adicionar_opcoes_leitura(parser):
+    parser.add_argument("--lazy", action="store_true", help="Lê o DOCX sem carregar as mídias na memória (para pacotes muito grandes).")
+    parser.add_argument("--stream", action="store_true", help="Lê o document.xml em fluxo, com memória constante (para documentos muito longos; implica --lazy).")
+
+# Função para adicionar as opções do cache de conversões a um subcomando
+def adicionar_opcoes_cache(parser):
+    parser.add_argument("--cache", action="store_true", help="Reaproveita conversões anteriores de documentos inalterados (cache no diretório do usuário).")
+    parser.add_argument("--cache-dir", metavar="DIR", help="Usa o cache de conversões em DIR (implica --cache).")
+
+# Função para obter o diretório do cache escolhido nos argumentos (None sem cache)
+def diretorio_cache(args):
+    if args.cache_dir:
+        return args.cache_dir
+    if args.cache:
+        from wordtomd.cache import diretorio_cache_padrao
+        return diretorio_cache_padrao()
+    return None
+
+# Função para montar o parser de argumentos da linha de comando
+def criar_parser():
+    parser = argparse.ArgumentParser(prog="wordtomd", description="Converte documentos Word (.docx) para Markdown (.md).")
+    subparsers = parser.add_subparsers(dest="comando")
+
+    parser_convert = subparsers.add_parser("convert", help="Converte um arquivo DOCX para Markdown.")
+    parser_convert.add_argument("entrada", metavar="IN", help="Arquivo .docx a ser convertido.")
+    parser_convert.add_argument("saida", metavar="OUT", help="Diretório onde o .md e a pasta de imagens serão salvos.")
+    parser_convert.add_argument("--header", choices=TIPOS_CABECALHO, default="Topico", help="Tipo de cabeçalho (padrão: Topico).")
+    parser_convert.add_argument("--stdout", action="store_true", help="Escreve o Markdown na saída padrão em vez de OUT/<nome>.md (as imagens continuam em OUT).")
+    adicionar_opcoes_leitura(parser_convert)
+    adicionar_opcoes_cache(parser_convert)
+    adicionar_opcoes_perfil(parser_convert)
+    parser_convert.set_defaults(func=comando_convert)
+
+    parser_batch = subparsers.add_parser("batch", help="Converte todos os arquivos DOCX de um diretório.")
+    parser_batch.add_argument("entrada", metavar="IN_DIR", help="Diretório contendo arquivos .docx.")
+    parser_batch.add_argument("saida", metavar="OUT_DIR", help="Diretório onde os .md e as pastas de imagens serão salvos.")
+    parser_batch.add_argument("--header", choices=TIPOS_CABECALHO, default="Topico", help="Tipo de cabeçalho (padrão: Topico).")
+    parser_batch.add_argument("--jobs", "-j", type=inteiro_positivo, default=None, help="Número de processos em paralelo (padrão: número de CPUs).")
+    parser_batch.add_argument("--incremental", action="store_true", help="Pula documentos inalterados desde a última execução (manifesto no diretório de saída).")
+    adicionar_opcoes_leitura(parser_batch)
+    adicionar_opcoes_cache(parser_batch)
+    adicionar_opcoes_perfil(parser_batch)
+    parser_batch.set_defaults(func=comando_batch)
+
+    parser_watch = subparsers.add_parser("watch", help="Observa um diretório e converte os DOCX à medida que são salvos.")
+    parser_watch.add_argument("entrada", metavar="IN_DIR", help="Diretório observado.")
+    parser_watch.add_argument("saida", metavar="OUT_DIR", help="Diretório onde os .md e as pastas de imagens serão salvos.")
+    parser_watch.add_argument("--header", choices=TIPOS_CABECALHO, default="Topico", help="Tipo de cabeçalho (padrão: Topico).")
+    parser_watch.add_argument("--jobs", "-j", type=inteiro_positivo, default=None, help="Número máximo de processos de conversão (padrão: número de CPUs).")
+    parser_watch.add_argument("--interval", type=float, default=1.0, help="Segundos entre as varreduras do diretório (padrão: 1).")
+    parser_watch.add_argument("--debounce", type=float, default=2.0, help="Segundos sem alterações antes de converter um documento salvo (padrão: 2).")
+    parser_watch.add_argument("--verbose", "-v", action="store_true", help="Registra também os salvamentos que não mudam o conteúdo.")
+    adicionar_opcoes_leitura(parser_watch)
+    adicionar_opcoes_cache(parser_watch)
+    parser_watch.set_defaults(func=comando_watch)
+
+    parser_gui = subparsers.add_parser("gui", help="Abre a interface gráfica.")
+    parser_gui.set_defaults(func=comando_gui)
+    return parser
+
+# Ponto de entrada da linha de comando
+def main(argv=None):
+    parser = criar_parser()
+    args = parser.parse_args(argv)
+    if args.comando is None:
+        parser.print_help()
+        return 2
+    return args.func(args)
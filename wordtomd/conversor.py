@@ -0,0 +1,608 @@
+import hashlib
+import os
+import re
+import shutil
+import zipfile
+from contextlib import ExitStack, nullcontext
+from datetime import datetime
+from functools import lru_cache, partial
+from docx import Document
+from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+from docx.oxml.ns import nsmap, qn
+from lxml import etree
+from wordtomd.cache import FluxoCopia, calcular_hash
+from wordtomd.pacote import PacoteDocx
+from wordtomd.saida import abrir_saida, caminho_temporario
+from wordtomd.tabela import linha_markdown, linhas_tabela
+from wordtomd.texto import EstilosDocumento, extrair_texto_paragrafo
+
+# Tamanho dos blocos usados para ler e gravar imagens sem carregá-las inteiras na memória
+TAMANHO_BLOCO = 64 * 1024
+
+# Extensão de arquivo de cada tipo de imagem (demais tipos usam a extensão da parte no pacote)
+EXTENSOES_IMAGEM = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/gif": ".gif",
+    "image/bmp": ".bmp",
+    "image/tiff": ".tiff",
+    "image/svg+xml": ".svg",
+    "image/x-emf": ".emf",
+    "image/x-wmf": ".wmf",
+}
+
+# Expressões XPath pré-compiladas para localizar imagens (DrawingML e VML) no documento.
+# Só o a:blip da própria imagem é considerado: o svgBlip dentro de a:extLst é a versão SVG da
+# mesma figura, e o conteúdo de mc:Fallback repete o de mc:Choice para leitores antigos.
+NAMESPACES_IMAGEM = {
+    "w": nsmap["w"],
+    "r": nsmap["r"],
+    "a": nsmap["a"],
+    "v": "urn:schemas-microsoft-com:vml",
+    "mc": "http://schemas.openxmlformats.org/markup-compatibility/2006",
+}
+XPATH_DESENHOS = etree.XPath(".//w:drawing | .//w:pict", namespaces=NAMESPACES_IMAGEM)
+XPATH_REFERENCIAS_IMAGEM = etree.XPath(
+    ".//w:drawing//a:blip[not(ancestor::a:extLst) and not(ancestor::mc:Fallback)]/@r:embed"
+    " | .//w:pict//v:imagedata[not(ancestor::mc:Fallback)]/@r:id",
+    namespaces=NAMESPACES_IMAGEM,
+)
+TAG_PARAGRAFO = qn("w:p")
+TAG_TABELA = qn("w:tbl")
+
+# Função para obter o texto de um parágrafo do documento DOCX, mantendo o estilo de negrito e itálico quando aplicado.
+def obter_texto_paragrafo(para):
+    """
+    Função para obter o texto de um parágrafo do documento DOCX,
+    mantendo o estilo de negrito e itálico quando aplicado.
+
+    Args:
+        para (docx.text.paragraph.Paragraph): Parágrafo do documento DOCX.
+
+    Returns:
+        str: Texto do parágrafo com estilos de formatação aplicados.
+    """
+    partes = []
+    for run in para.runs:
+        run_text = run.text
+        if run_text.strip():  # Verifica se o texto não é apenas espaços
+            if run.bold and run.italic:
+                run_text = f"___{run_text}___"
+            elif run.bold:
+                run_text = f"**{run_text}**"
+            elif run.italic:
+                run_text = f"_{run_text}_"
+        partes.append(run_text)
+
+    return "".join(partes)
+
+# Função para salvar uma imagem em um diretório específico.
+def salvar_imagem(bytes_imagem, diretorio_imagem, nome_imagem, nome_arquivo, sobrescrever=True):
+    """
+    Função para salvar uma imagem em um diretório específico.
+
+    Args:
+        bytes_imagem (bytes | arquivo binário): Bytes da imagem a ser salva, ou um
+            fluxo binário de onde ela é copiada em blocos.
+        diretorio_imagem (str): Diretório onde a imagem será salva.
+        nome_imagem (str): Nome da imagem a ser salva.
+        sobrescrever (bool, opcional): Se False, uma imagem já existente com o mesmo nome não é regravada.
+
+    Returns:
+        str: Caminho completo da imagem salva.
+    """
+    if not os.path.exists(diretorio_imagem):
+        os.makedirs(diretorio_imagem)
+    nome_imagem = f"{nome_arquivo}_{nome_imagem}"
+    caminho_imagem = os.path.join(diretorio_imagem, nome_imagem)
+    if sobrescrever or not os.path.exists(caminho_imagem):
+        # Gravação atômica: a imagem só aparece com o nome final quando está completa
+        temporario = caminho_temporario(caminho_imagem)
+        try:
+            with open(temporario, "wb") as arquivo_imagem:
+                if isinstance(bytes_imagem, bytes):
+                    arquivo_imagem.write(bytes_imagem)
+                else:
+                    shutil.copyfileobj(bytes_imagem, arquivo_imagem, TAMANHO_BLOCO)
+            os.replace(temporario, caminho_imagem)
+        except BaseException:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+            raise
+    return ".\\" + caminho_imagem
+
+# Função para exportar uma imagem do pacote DOCX, nomeada pelo hash do conteúdo.
+def exportar_imagem(pacote, parte_imagem, diretorio_imagem, nome_arquivo, gravar=True):
+    """
+    Função para exportar uma imagem do pacote DOCX, lendo-a em blocos direto do
+    arquivo zip. A imagem é nomeada pelo hash do conteúdo com a extensão do seu
+    tipo, de modo que imagens repetidas são gravadas uma única vez e arquivos
+    idênticos já existentes não são regravados.
+
+    Args:
+        pacote (zipfile.ZipFile): Arquivo DOCX aberto como zip.
+        parte_imagem (docx.image.imagepart.ImagePart): Parte da imagem no pacote.
+        diretorio_imagem (str): Diretório onde a imagem será salva.
+        nome_arquivo (str): Nome do documento, usado como prefixo da imagem.
+        gravar (bool, opcional): Se False, apenas o nome e o caminho são calculados,
+            sem gravar a imagem.
+
+    Returns:
+        tuple: Nome da imagem e caminho retornado por salvar_imagem.
+    """
+    membro = parte_imagem.partname.lstrip("/")
+    hash_imagem = hashlib.sha256()
+    with pacote.open(membro) as fluxo_imagem:
+        for bloco in iter(lambda: fluxo_imagem.read(TAMANHO_BLOCO), b""):
+            hash_imagem.update(bloco)
+    extensao = EXTENSOES_IMAGEM.get(parte_imagem.content_type, "." + parte_imagem.partname.ext)
+    nome_imagem = f"{hash_imagem.hexdigest()[:16]}{extensao}"
+    if not gravar:
+        return nome_imagem, ".\\" + os.path.join(diretorio_imagem, f"{nome_arquivo}_{nome_imagem}")
+    with pacote.open(membro) as fluxo_imagem:
+        caminho_imagem = salvar_imagem(fluxo_imagem, diretorio_imagem, nome_imagem, nome_arquivo, sobrescrever=False)
+    return nome_imagem, caminho_imagem
+
+# Função para remover imagens de conversões anteriores que não são mais referenciadas.
+def remover_imagens_antigas(diretorio_imagem, nome_arquivo, nomes_atuais):
+    """
+    Função para remover, do diretório de imagens do documento, as imagens de
+    conversões anteriores que não são mais referenciadas.
+
+    Args:
+        diretorio_imagem (str): Diretório das imagens do documento.
+        nome_arquivo (str): Nome do documento, usado como prefixo das imagens.
+        nomes_atuais (set): Nomes (sem prefixo) das imagens da conversão atual.
+    """
+    if not os.path.isdir(diretorio_imagem):
+        return
+    prefixo = f"{nome_arquivo}_"
+    for nome in os.listdir(diretorio_imagem):
+        if nome.startswith(prefixo) and nome[len(prefixo):] not in nomes_atuais:
+            os.remove(os.path.join(diretorio_imagem, nome))
+
+# Função para indexar as imagens referenciadas em cada parágrafo do documento.
+def indexar_imagens(elemento_raiz):
+    """
+    Função para indexar, em uma única passada, as imagens referenciadas
+    em cada parágrafo do documento.
+
+    Args:
+        elemento_raiz (lxml.etree._Element): Elemento a ser percorrido (normalmente o corpo do documento).
+
+    Returns:
+        dict: Mapeia cada elemento w:p que contém desenhos para a lista de rIds
+        das imagens referenciadas, na ordem em que aparecem no documento.
+    """
+    indice = {}
+    for desenho in XPATH_DESENHOS(elemento_raiz):
+        for paragrafo in desenho.iterancestors(TAG_PARAGRAFO):
+            indice.setdefault(paragrafo, [])
+    for rId in XPATH_REFERENCIAS_IMAGEM(elemento_raiz):
+        for paragrafo in rId.getparent().iterancestors(TAG_PARAGRAFO):
+            indice[paragrafo].append(str(rId))
+    return indice
+
+# Expressões regulares para identificar URLs e o host (com porta/usuário) de uma URL
+REGEX_URL = re.compile(r'(http[s]?://[^\s]+)')
+REGEX_HOST = re.compile(r'://([^/?#]*)')
+
+# Extrator de domínios criado sob demanda, uma única vez por processo
+_extrator_dominio = None
+
+# Função para obter o domínio registrado de um host, sem acesso à rede.
+@lru_cache(maxsize=4096)
+def obter_dominio(host):
+    """
+    Função para obter o domínio registrado de um host usando apenas a lista
+    de sufixos públicos embutida no tldextract (nenhum download é feito).
+    O resultado é memorizado por host.
+
+    Args:
+        host (str): Host da URL (ex.: "www.exemplo.com.br").
+
+    Returns:
+        str: Domínio registrado (ex.: "exemplo.com.br").
+    """
+    global _extrator_dominio
+    if _extrator_dominio is None:
+        import tldextract  # Importado apenas quando há URLs, para manter a CLI leve
+        _extrator_dominio = tldextract.TLDExtract(cache_dir=None, suffix_list_urls=(), fallback_to_snapshot=True)
+    return _extrator_dominio(host).registered_domain
+
+# Função para substituir uma URL encontrada pelo link em Markdown.
+def substituir_url(match):
+    url = match.group(0)
+    dominio = obter_dominio(REGEX_HOST.search(url).group(1))
+    return f'[{dominio}]({url})'
+
+# Função para identificar e formatar links em um texto.
+def formatar_link(texto):
+    """
+    Função para identificar e formatar links em um texto.
+
+    Args:
+        texto (str): Texto contendo URLs.
+
+    Returns:
+        str: Texto com URLs formatadas em Markdown.
+    """
+    # Verificação rápida: a maioria dos textos não tem URL e dispensa a expressão regular
+    if "http" not in texto:
+        return texto
+
+    # Substituir todas as URLs pelo formato desejado
+    return REGEX_URL.sub(substituir_url, texto)
+
+# Função para gerar o cabeçalho (front matter) do arquivo Markdown.
+def gerar_cabecalho(tipo_cabecalho):
+    """
+    Função para gerar o cabeçalho (front matter) do arquivo Markdown.
+
+    Args:
+        tipo_cabecalho (str): Tipo de cabeçalho ("Topico" ou "Sub-Topico").
+
+    Returns:
+        list: Linhas do cabeçalho.
+    """
+    conteudo_markdown = []
+    data_atual = datetime.now()
+    dia = f'{data_atual.day:02d}'
+    mes = f'{data_atual.month:02d}'
+    ano = f'{data_atual.year:04d}'
+
+    # Verifica o tipo de cabeçalho selecionado e adiciona ao conteúdo Markdown
+    if(tipo_cabecalho == "Topico"):
+        conteudo_markdown.append('---')
+        conteudo_markdown.append('title: "Titulo da sua documentação"')
+        conteudo_markdown.append('type: docs')
+        conteudo_markdown.append('last_updated: ')
+        conteudo_markdown.append(f'\tdate: "{mes}/{dia}/{ano}"')
+        conteudo_markdown.append('\tauthor: "Seu nome"')
+        conteudo_markdown.append('sidebar_position: 1')
+        conteudo_markdown.append('---\n')
+    else:
+        conteudo_markdown.append('---')
+        conteudo_markdown.append('title: "Titulo da sua documentação"')
+        conteudo_markdown.append('type: docs')
+        conteudo_markdown.append('menu: ')
+        conteudo_markdown.append('\tmain:')
+        conteudo_markdown.append('\t\tsidebar_position: 1')
+        conteudo_markdown.append('description: "Descrição da sua documentação"')
+        conteudo_markdown.append('---\n')
+    return conteudo_markdown
+
+# Função para obter a parte de imagem apontada por uma relação de um documento do python-docx.
+def parte_imagem_documento(documento, rId):
+    """
+    Função para obter a parte de imagem apontada por uma relação do documento.
+
+    Args:
+        documento (docx.document.Document): Documento DOCX carregado.
+        rId (str): Identificador da relação (r:embed / r:id).
+
+    Returns:
+        docx.image.imagepart.ImagePart | None: Parte da imagem, ou None se a relação
+        não existir, for externa ou não for de imagem.
+    """
+    relacao = documento.part.rels.get(rId)
+    if relacao is None or relacao.is_external or "image" not in relacao.reltype:
+        return None
+    return relacao.target_part
+
+# Classe que exporta as imagens do documento sob demanda, uma única vez cada
+class ExportadorImagens:
+    """
+    Exporta as imagens do documento à medida que são referenciadas, guardando
+    o Markdown de cada rId. Cada parte de imagem é gravada uma única vez, mesmo
+    que várias relações apontem para ela.
+
+    Args:
+        obter_parte_imagem (callable): Recebe um rId e retorna a parte da imagem (com
+            partname e content_type) ou None (ex.: parte_imagem_documento ou PacoteDocx.parte_imagem).
+        pacote (zipfile.ZipFile): Arquivo DOCX aberto como zip, de onde as imagens são copiadas.
+        caminho_md_saida (str): Caminho do arquivo Markdown, base dos caminhos relativos.
+        diretorio_imagem (str): Diretório onde as imagens serão salvas.
+        nome_arquivo (str): Nome do documento, usado como prefixo das imagens.
+        gravar_imagens (bool, opcional): Se False, só o Markdown das imagens é gerado;
+            nada é gravado nem removido em diretorio_imagem.
+    """
+    def __init__(self, obter_parte_imagem, pacote, caminho_md_saida, diretorio_imagem, nome_arquivo, gravar_imagens=True):
+        self.obter_parte_imagem = obter_parte_imagem
+        self.pacote = pacote
+        self.caminho_md_saida = caminho_md_saida
+        self.diretorio_imagem = diretorio_imagem
+        self.nome_arquivo = nome_arquivo
+        self.gravar_imagens = gravar_imagens
+        self.markdown_imagens = {}
+        self.imagens_exportadas = {}
+
+    # Função para exportar a imagem de um rId, retornando o seu Markdown (None se não for imagem)
+    def exportar(self, rId):
+        if rId not in self.markdown_imagens:
+            markdown = None
+            parte_imagem = self.obter_parte_imagem(rId)
+            if parte_imagem is not None:
+                # Várias relações podem apontar para a mesma parte
+                if parte_imagem.partname not in self.imagens_exportadas:
+                    self.imagens_exportadas[parte_imagem.partname] = exportar_imagem(
+                        self.pacote, parte_imagem, self.diretorio_imagem, self.nome_arquivo, self.gravar_imagens)
+                nome_imagem, caminho_imagem_salva = self.imagens_exportadas[parte_imagem.partname]
+                caminho_imagem_relativa = os.path.relpath(caminho_imagem_salva, os.path.dirname(self.caminho_md_saida))
+                markdown = f"![{nome_imagem}]({caminho_imagem_relativa})\n"
+            self.markdown_imagens[rId] = markdown
+        return self.markdown_imagens[rId]
+
+    # Função para remover as imagens de conversões anteriores que não foram exportadas agora
+    def remover_antigas(self):
+        if not self.gravar_imagens:
+            return
+        remover_imagens_antigas(self.diretorio_imagem, self.nome_arquivo, {nome_imagem for nome_imagem, _ in self.imagens_exportadas.values()})
+
+# Função para exportar as imagens referenciadas no corpo do documento.
+def exportar_imagens(exportador, indice_imagens):
+    """
+    Função para exportar apenas as imagens realmente referenciadas no corpo do documento.
+    As imagens de conversões anteriores não são removidas aqui, e sim depois que o
+    novo Markdown substitui o anterior (ExportadorImagens.remover_antigas).
+
+    Args:
+        exportador (ExportadorImagens): Exportador das imagens do documento.
+        indice_imagens (dict): Índice retornado por indexar_imagens.
+
+    Returns:
+        dict: Markdown da imagem para cada rId referenciado.
+    """
+    mapa_imagens = {}
+    for rIds in indice_imagens.values():
+        for rId in rIds:
+            markdown = exportador.exportar(rId)
+            if markdown is not None:
+                mapa_imagens[rId] = markdown
+    return mapa_imagens
+
+# Função para criar o escritor dos elementos (parágrafos e tabelas) do corpo em Markdown.
+def criar_escritor_elementos(estilos, indice_imagens, mapa_imagens, saida, perfil=None):
+    """
+    Função para criar o escritor dos elementos do corpo: uma função que recebe
+    um filho w:p ou w:tbl de w:body e escreve seu Markdown.
+
+    Args:
+        estilos (EstilosDocumento): Estilos pré-processados do documento.
+        indice_imagens (dict): Índice retornado por indexar_imagens (consultado a cada elemento).
+        mapa_imagens (dict): Markdown da imagem para cada rId (consultado a cada elemento).
+        saida (SaidaMarkdown): Destino do Markdown.
+        perfil (Perfil, opcional): Perfil onde medir cada tipo de elemento.
+
+    Returns:
+        callable: Função que escreve um elemento w:p ou w:tbl.
+    """
+    formatar = formatar_link
+    if perfil is not None:
+        # Conta as URLs de cada texto além de medir a formatação dos links
+        def formatar(texto):
+            if "http" in texto:
+                perfil.contar("links", len(REGEX_URL.findall(texto)))
+            return formatar_link_cronometrado(texto)
+        formatar_link_cronometrado = perfil.cronometrar("formatar_link", formatar_link)
+
+    # Função para adicionar parágrafos ao conteúdo Markdown
+    def adicionar_paragrafo(elemento_p):
+        texto = extrair_texto_paragrafo(elemento_p, estilos)
+        texto = formatar(texto)  # Formatar links no texto do parágrafo
+        nome_estilo = estilos.nome_paragrafo(elemento_p)
+        if nome_estilo.startswith('Heading'):
+            nivel = int(re.search(r'\d+', nome_estilo).group())
+            saida.escrever(f"{'#' * nivel} {texto}\n")
+            if perfil is not None:
+                perfil.contar("titulos")
+        elif nome_estilo == 'Normal' and elemento_p.alignment == WD_PARAGRAPH_ALIGNMENT.CENTER:
+            saida.escrever(f"<p align='center'>{texto}</p>\n")
+        else:
+            saida.escrever(f"{texto}\n")
+
+    # Função para obter o Markdown de um parágrafo de célula de tabela, com links e imagens
+    def texto_paragrafo_celula(elemento_p):
+        texto = formatar(extrair_texto_paragrafo(elemento_p, estilos))
+        # Concatenar as imagens do parágrafo sem quebra de linha
+        for rId in indice_imagens.get(elemento_p, ()):
+            if rId in mapa_imagens:
+                texto += mapa_imagens[rId].strip()
+        return texto
+
+    # Função para adicionar tabelas ao conteúdo Markdown
+    def adicionar_tabela(elemento_tbl):
+        linhas = linhas_tabela(elemento_tbl, texto_paragrafo_celula)
+        cabecalhos = next(linhas, None)
+        if cabecalhos is None:
+            return  # Tabela sem linhas
+        saida.escrever("\n")
+        saida.escrever(linha_markdown(cabecalhos))
+        saida.escrever(linha_markdown(["---"] * len(cabecalhos)))
+        for celulas in linhas:
+            saida.escrever(linha_markdown(celulas))
+        saida.escrever("\n")
+
+    # Função para adicionar as imagens de um parágrafo ao conteúdo Markdown
+    def adicionar_imagens(rIds_imagens):
+        for rId in rIds_imagens:
+            if rId in mapa_imagens:
+                saida.escrever(mapa_imagens[rId])
+
+    # Com perfil, cada tipo de elemento é medido; sem ele, as funções são chamadas diretamente
+    if perfil is not None:
+        adicionar_paragrafo = perfil.cronometrar("paragrafos", adicionar_paragrafo)
+        adicionar_tabela = perfil.cronometrar("tabelas", adicionar_tabela)
+        adicionar_imagens = perfil.cronometrar("imagens", adicionar_imagens)
+
+    # Função para escrever um parágrafo (ou as imagens dele) ou uma tabela
+    def escrever_elemento(elemento):
+        if elemento.tag == TAG_PARAGRAFO:
+            rIds_imagens = indice_imagens.get(elemento)
+            if rIds_imagens is not None:
+                adicionar_imagens(rIds_imagens)
+            else:
+                adicionar_paragrafo(elemento)
+        else:
+            adicionar_tabela(elemento)
+
+    return escrever_elemento
+
+# Função para escrever o corpo do documento em Markdown.
+def escrever_corpo(elemento_corpo, estilos, indice_imagens, mapa_imagens, saida, perfil=None):
+    """
+    Função para percorrer o corpo do documento e escrever cada parágrafo,
+    imagem e tabela em Markdown.
+
+    Args:
+        elemento_corpo (docx.oxml.document.CT_Body): Elemento w:body do documento.
+        estilos (EstilosDocumento): Estilos pré-processados do documento.
+        indice_imagens (dict): Índice retornado por indexar_imagens.
+        mapa_imagens (dict): Markdown da imagem para cada rId (de exportar_imagens).
+        saida (SaidaMarkdown): Destino do Markdown.
+        perfil (Perfil, opcional): Perfil onde medir cada tipo de elemento.
+    """
+    escrever_elemento = criar_escritor_elementos(estilos, indice_imagens, mapa_imagens, saida, perfil)
+
+    # Percorre os filhos do corpo uma única vez, em ordem, direto nos elementos w:p/w:tbl.
+    # (documento.iter_inner_content() usa a união XPath "./w:p | ./w:tbl", cuja ordenação
+    # em ordem de documento no libxml2 é quadrática no número de elementos)
+    for elemento in elemento_corpo.iterchildren(TAG_PARAGRAFO, TAG_TABELA):
+        escrever_elemento(elemento)
+
+# Função para escrever o corpo do documento em Markdown lendo document.xml em fluxo.
+def escrever_corpo_em_fluxo(pacote_docx, estilos, exportador, saida, perfil=None):
+    """
+    Função para escrever o corpo do documento em Markdown à medida que
+    word/document.xml é lido: cada parágrafo ou tabela do corpo é convertido
+    assim que se fecha e depois descartado, e suas imagens são exportadas na
+    hora. A memória fica constante, qualquer que seja o tamanho do documento.
+
+    Args:
+        pacote_docx (PacoteDocx): Pacote aberto com carregar_corpo=False.
+        estilos (EstilosDocumento): Estilos pré-processados do documento.
+        exportador (ExportadorImagens): Exportador das imagens do documento.
+        saida (SaidaMarkdown): Destino do Markdown.
+        perfil (Perfil, opcional): Perfil onde medir cada tipo de elemento.
+    """
+    # Índice e mapa de imagens do elemento atual, preenchidos antes de escrevê-lo
+    indice_imagens = {}
+    mapa_imagens = {}
+    escrever_elemento = criar_escritor_elementos(estilos, indice_imagens, mapa_imagens, saida, perfil)
+    for elemento in pacote_docx.iterar_corpo():
+        indice_imagens.clear()
+        indice_imagens.update(indexar_imagens(elemento))
+        for rIds in indice_imagens.values():
+            for rId in rIds:
+                markdown = exportador.exportar(rId)
+                if markdown is not None:
+                    mapa_imagens[rId] = markdown
+        escrever_elemento(elemento)
+    indice_imagens.clear()
+
+# Função para converter um documento DOCX para Markdown.
+def converter_docx_para_markdown(caminho_docx, caminho_md_saida, diretorio_imagem, nome_arquivo, tipo_cabecalho, fluxo_saida=None, perfil=None,
+                                 cache=None, leitura_preguicosa=False, em_fluxo=False, gravar_imagens=True):
+    """
+    Função para converter um documento DOCX para Markdown.
+    O Markdown é escrito de forma incremental, à medida que os elementos são convertidos.
+
+    Args:
+        caminho_docx (str): Caminho do arquivo DOCX a ser convertido.
+        caminho_md_saida (str): Caminho de saída para o arquivo Markdown convertido.
+        diretorio_imagem (str): Diretório onde as imagens serão salvas.
+        fluxo_saida (io.TextIOBase, opcional): Fluxo de texto onde escrever o Markdown
+            (ex.: sys.stdout ou io.StringIO) em vez do arquivo caminho_md_saida.
+            Os caminhos das imagens continuam relativos a caminho_md_saida.
+        perfil (wordtomd.perfil.Perfil, opcional): Perfil onde acumular o tempo de cada
+            fase e elemento e os contadores da conversão. Sem perfil, nada é medido.
+        cache (wordtomd.cache.CacheConversao, opcional): Cache de conversões. Se o
+            documento (e as demais partes da chave) não mudou e as imagens ainda
+            existem, apenas o cabeçalho é gerado e o corpo vem do cache.
+        leitura_preguicosa (bool, opcional): Ler o pacote com PacoteDocx em vez de
+            docx.Document: só o XML do documento, dos estilos e das relações é carregado,
+            e as imagens são copiadas direto do arquivo (mapeado em memória) ao serem
+            exportadas. Reduz o pico de memória de documentos com muitas mídias.
+        em_fluxo (bool, opcional): Ler word/document.xml em fluxo, convertendo e
+            descartando cada parágrafo ou tabela do corpo assim que se fecha, sem montar
+            a árvore do documento inteiro. Implica leitura_preguicosa. O Markdown gerado
+            é o mesmo; a memória fica constante em documentos muito longos.
+        gravar_imagens (bool, opcional): Se False, as imagens não são gravadas em
+            diretorio_imagem (nem as antigas removidas), mas o Markdown traz os mesmos
+            links. Usado pela pré-visualização, que só mostra o texto.
+    """
+    if perfil is None:
+        fase = lambda nome: nullcontext()
+    else:
+        fase = perfil.fase
+
+    if cache is not None:
+        with fase("cache"):
+            chave = cache.chave(calcular_hash(caminho_docx), tipo_cabecalho, nome_arquivo, caminho_md_saida, diretorio_imagem)
+            entrada = cache.obter(chave)
+        if entrada is not None:
+            corpo, imagens = entrada
+            if not gravar_imagens or all(os.path.exists(os.path.join(diretorio_imagem, nome_imagem)) for nome_imagem in imagens):
+                with fase("corpo"), abrir_saida(caminho_md_saida, fluxo_saida) as saida:
+                    if perfil is not None:
+                        perfil.contar("cache_acertos")
+                    saida.escrever_blocos(gerar_cabecalho(tipo_cabecalho))
+                    saida.fluxo.write(corpo)
+                return
+
+    with ExitStack() as recursos:
+        with fase("carregar"):
+            if leitura_preguicosa or em_fluxo:
+                pacote_docx = recursos.enter_context(PacoteDocx(caminho_docx, carregar_corpo=not em_fluxo))
+                elemento_estilos = pacote_docx.elemento_estilos
+                obter_parte_imagem = pacote_docx.parte_imagem
+                pacote = pacote_docx.zip
+            else:
+                documento = Document(caminho_docx)
+                elemento_estilos = documento.styles.element
+                obter_parte_imagem = partial(parte_imagem_documento, documento)
+                pacote = recursos.enter_context(zipfile.ZipFile(caminho_docx))
+            estilos = EstilosDocumento(elemento_estilos)
+
+            if not em_fluxo:
+                elemento_corpo = pacote_docx.elemento_documento.body if leitura_preguicosa else documento.element.body
+                # Índice das imagens referenciadas por parágrafo, construído uma única vez
+                indice_imagens = indexar_imagens(elemento_corpo)
+
+        exportador = ExportadorImagens(obter_parte_imagem, pacote, caminho_md_saida, diretorio_imagem, nome_arquivo, gravar_imagens)
+        if not em_fluxo:
+            with fase("imagens"):
+                mapa_imagens = exportar_imagens(exportador, indice_imagens)
+
+        with fase("corpo"), abrir_saida(caminho_md_saida, fluxo_saida) as saida:
+            if perfil is not None:
+                saida.fluxo = perfil.medir_fluxo(saida.fluxo)
+            # Adicionando o cabeçalho do arquivo Markdown
+            saida.escrever_blocos(gerar_cabecalho(tipo_cabecalho))
+            if cache is not None:
+                # O corpo é copiado enquanto é escrito e guardado sem o cabeçalho; como o limite
+                # do cache é em bytes e cada caractere ocupa ao menos um, corpos com mais
+                # caracteres que o limite deixam de ser copiados
+                saida.fluxo = copia = FluxoCopia(saida.fluxo, cache.tamanho_maximo)
+            if em_fluxo:
+                # As imagens são exportadas durante a leitura do corpo
+                escrever_corpo_em_fluxo(pacote_docx, estilos, exportador, saida, perfil)
+                mapa_imagens = {rId: markdown for rId, markdown in exportador.markdown_imagens.items() if markdown is not None}
+            else:
+                escrever_corpo(elemento_corpo, estilos, indice_imagens, mapa_imagens, saida, perfil)
+
+        # Só depois que o novo Markdown está no lugar as imagens que ele não usa são removidas
+        with fase("imagens"):
+            exportador.remover_antigas()
+
+    if perfil is not None:
+        perfil.contar("imagens_exportadas", len(set(mapa_imagens.values())))
+    corpo = None if cache is None else copia.texto()
+    if corpo is not None:
+        prefixo = f"{nome_arquivo}_"
+        if gravar_imagens:
+            imagens = sorted(nome for nome in os.listdir(diretorio_imagem) if nome.startswith(prefixo)) if os.path.isdir(diretorio_imagem) else []
+        else:
+            # Nomes que as imagens teriam, para que uma conversão que as grava não use esta entrada sem elas
+            imagens = sorted(prefixo + nome_imagem for nome_imagem, _ in exportador.imagens_exportadas.values())
+        cache.guardar(chave, corpo, imagens)
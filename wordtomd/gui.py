@@ -0,0 +1,339 @@
+import io
+import os
+import queue
+import shutil
+import sys
+import threading
+import time
+import tkinter
+from tkinter import filedialog, messagebox
+from tkinter import *
+import tkinter.messagebox
+import customtkinter
+from PIL import Image, ImageTk
+from wordtomd.cache import CacheConversao
+from wordtomd.conversor import converter_docx_para_markdown, gerar_cabecalho
+from wordtomd.lote import converter_em_lote
+
+# Função para iniciar a conversão do arquivo DOCX para Markdown
+def iniciar_conversao(tipo_cabecalho, cache=None):
+    try:
+        # Abre um diálogo para selecionar o arquivo DOCX
+        caminho_docx = filedialog.askopenfilename(filetypes=[("Arquivos Word", "*.docx")])
+        nome_arquivo = os.path.splitext(os.path.basename(caminho_docx))[0]
+        # Abre um diálogo para selecionar o diretório de saída
+        diretorio_saida = filedialog.askdirectory()
+        caminho_md_saida = os.path.join(diretorio_saida, f"{nome_arquivo}.md")
+        diretorio_imagem = os.path.join(diretorio_saida, f"img_{nome_arquivo}")
+        # Chama a função de conversão
+        converter_docx_para_markdown(caminho_docx, caminho_md_saida, diretorio_imagem, nome_arquivo, tipo_cabecalho, cache=cache)
+        messagebox.showinfo("Sucesso", "Conversão realizada com sucesso!")
+    except Exception as e:
+        messagebox.showerror("Erro", f"Ocorreu um erro: {str(e)}")
+
+# Função para iniciar a conversão em lote sem bloquear a interface gráfica
+def iniciar_conversao_em_lote(tipo_cabecalho, app):
+    try:
+        # Abre um diálogo para selecionar o diretório contendo arquivos DOCX
+        diretorio_docx = filedialog.askdirectory()
+        # Abre um diálogo para selecionar o diretório de saída
+        diretorio_saida = filedialog.askdirectory()
+        if not diretorio_docx or not diretorio_saida:
+            return
+
+        # A conversão roda em outra thread (que distribui os arquivos entre processos);
+        # o progresso volta para a janela por uma fila lida com after()
+        fila_progresso = queue.Queue()
+
+        def executar_lote():
+            try:
+                resultados = converter_em_lote(diretorio_docx, diretorio_saida, tipo_cabecalho,
+                                               ao_progredir=lambda resultado, concluidos, total: fila_progresso.put(("progresso", resultado, concluidos, total)),
+                                               diretorio_cache=app.cache.diretorio)
+                fila_progresso.put(("fim", resultados))
+            except Exception as e:
+                fila_progresso.put(("erro", e))
+
+        threading.Thread(target=executar_lote, daemon=True).start()
+        app.acompanhar_lote(fila_progresso)
+    except Exception as e:
+        messagebox.showerror("Erro", f"Ocorreu um erro: {str(e)}")
+
+# Função para obter o caminho absoluto para o recurso, funciona para dev e para PyInstaller
+def resource_path(relative_path):
+    """ Obtenha o caminho absoluto para o recurso, funciona para dev e para PyInstaller """
+    try:
+        # PyInstaller cria uma pasta temporária e armazena o caminho nela
+        base_path = sys._MEIPASS
+    except Exception:
+        base_path = os.path.abspath(".")
+
+    return os.path.join(base_path, relative_path)
+
+# Classe principal da aplicação GUI
+class App(customtkinter.CTk):
+    def __init__(self):
+        super().__init__()
+
+        # Configuração da janela principal
+        self.title("WordToMd")
+        self.geometry(f"{1100}x{580}")
+
+        # Configuração do layout de grade (2x1)
+        self.grid_columnconfigure(1, weight=1)
+        self.grid_columnconfigure(2, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        # Criação do frame da barra lateral com widgets
+        self.sidebar_frame = customtkinter.CTkFrame(self, width=140, corner_radius=0)
+        self.sidebar_frame.grid(row=0, column=0, rowspan=1, sticky="nsew")
+        self.sidebar_frame.grid_rowconfigure(5, weight=1)
+
+        # Carregar e adicionar a imagem acima do texto "WordToMd"
+        imagem_path = resource_path("img/novo-logo-itau-png-sem-fundo.png")  # Use resource_path para obter o caminho correto
+        imagem = Image.open(imagem_path)
+        imagem = imagem.resize((150, 150), Image.LANCZOS)
+        self.logo = customtkinter.CTkImage(light_image=imagem, size=(150, 150))
+        self.logo_label = customtkinter.CTkLabel(self.sidebar_frame, image=self.logo, text="")
+        self.logo_label.grid(row=0, column=0, padx=20, pady=(20, 10))
+        
+        self.logo_label_text = customtkinter.CTkLabel(self.sidebar_frame, text="WordToMd", font=customtkinter.CTkFont(size=20, weight="bold"))
+        self.logo_label_text.grid(row=1, column=0, padx=20, pady=(10, 10))
+        
+        self.sidebar_button_1 = customtkinter.CTkButton(self.sidebar_frame, text="Ler Arquivo", command=self.ler_arquivo)
+        self.sidebar_button_1.grid(row=2, column=0, padx=20, pady=10)
+        self.sidebar_button_2 = customtkinter.CTkButton(self.sidebar_frame, text="Ler Varios Arquivos", command=self.ler_varios_arquivos)
+        self.sidebar_button_2.grid(row=3, column=0, padx=20, pady=10)
+        self.sidebar_button_4 = customtkinter.CTkButton(self.sidebar_frame, text="Pré-visualizar", command=self.pre_visualizar)
+        self.sidebar_button_4.grid(row=4, column=0, padx=20, pady=10)
+        self.sidebar_button_3 = customtkinter.CTkButton(self.sidebar_frame, text="Sair", command=self.sair)
+        self.sidebar_button_3.grid(row=5, column=0, padx=10, pady=5)
+        
+        
+        self.appearance_mode_label = customtkinter.CTkLabel(self.sidebar_frame, text="Aparência:", anchor="w")
+        self.appearance_mode_label.grid(row=6, column=0, padx=20, pady=(10, 0))
+        self.appearance_mode_optionemenu = customtkinter.CTkOptionMenu(self.sidebar_frame, values=["Light", "Dark", "System"],
+                                                                       command=self.change_appearance_mode_event)
+        self.appearance_mode_optionemenu.grid(row=7, column=0, padx=20, pady=(10, 10))
+        self.scaling_label = customtkinter.CTkLabel(self.sidebar_frame, text="Escala do aplicativo:", anchor="w")
+        self.scaling_label.grid(row=8, column=0, padx=20, pady=(10, 0))
+        self.scaling_optionemenu = customtkinter.CTkOptionMenu(self.sidebar_frame, values=["80%", "90%", "100%", "110%", "120%", "130%"],
+                                                               command=self.change_scaling_event)
+        self.scaling_optionemenu.grid(row=9, column=0, padx=20, pady=(10, 20))
+
+        # Criação do frame para opções de cabeçalho
+        self.header_frame = customtkinter.CTkFrame(self)
+        self.header_frame.grid(row=0, column=1, padx=(20, 10), pady=(20, 20), sticky="nsew")
+        self.header_frame.grid_columnconfigure(0, weight=1)
+        self.header_frame.grid_rowconfigure(2, weight=1)
+
+        # Adicionar rótulo de título
+        self.options_label = customtkinter.CTkLabel(self.header_frame, text="Selecione o tipo de cabeçalho:", font=customtkinter.CTkFont(size=16, weight="bold"))
+        self.options_label.grid(row=0, column=0, padx=20, pady=(20, 10))
+
+        self.optionmenu_1 = customtkinter.CTkOptionMenu(self.header_frame, dynamic_resizing=False,
+                                                        values=["Topico", "Sub-Topico"],
+                                                        command=self.update_textbox)
+        self.optionmenu_1.grid(row=1, column=0, padx=20, pady=(10, 10))
+
+        # Adicionar caixa de texto dinâmica com altura aumentada
+        self.dynamic_textbox = customtkinter.CTkTextbox(self.header_frame, state="disabled")
+        self.dynamic_textbox.grid(row=2, column=0, padx=20, pady=(10, 10), sticky="nsew")
+
+        # Progresso da conversão em lote
+        self.progress_label = customtkinter.CTkLabel(self.header_frame, text="", anchor="w")
+        self.progress_label.grid(row=3, column=0, padx=20, pady=(0, 0), sticky="ew")
+        self.progressbar = customtkinter.CTkProgressBar(self.header_frame)
+        self.progressbar.grid(row=4, column=0, padx=20, pady=(5, 20), sticky="ew")
+        self.progressbar.set(0)
+
+        # Criação do frame para a caixa de texto principal
+        self.textbox_frame = customtkinter.CTkFrame(self)
+        self.textbox_frame.grid(row=0, column=2, padx=(10, 20), pady=(20, 20), sticky="nsew")
+        self.textbox_frame.grid_columnconfigure(0, weight=1)
+        self.textbox_frame.grid_rowconfigure(0, weight=1)
+
+        # Criação da caixa de texto principal (também usada para a pré-visualização)
+        self.textbox = customtkinter.CTkTextbox(self.textbox_frame)
+        self.textbox.grid(row=0, column=0, padx=20, pady=(20, 5), sticky="nsew")
+        self.preview_label = customtkinter.CTkLabel(self.textbox_frame, text="", anchor="w")
+        self.preview_label.grid(row=1, column=0, padx=20, pady=(0, 10), sticky="ew")
+
+        # Inserir texto de descrição
+        self.textbox.insert("0.0", "Descrição:\n\n" + "Autor: Renan dos Reis Negrão\n\n" + "Aplicativo desenvolvido para facilitar a elaboração de novas documentaões técnicas para o GitHub Pages. Através da formatação de um arquivo word a aplicação reconhece e já converte o arquivo para um com extensão .md\n\n" + "Vamos de turma :)\n\n" +  "------------------------------\n\n" +  "Como usar o aplicativo?\n\n" +  "1. Selecione o tipo de cabeçalho desejado!\n\n" + "2. Clique em Ler Arquivo e selecione o arquivo word a ser convertido!\n"+ "OBS: O arquivo Word NÃO pode estar aberto durante a execução do programa!\n\n" + "3. Assim que selecionar o arquivo Word desejado, escolha qual o caminho onde será salvo seu arquivo .MD e a pasta com as imagens (Caso possua no documento)!\n\n")
+
+        # Desabilitar a caixa de texto
+        self.textbox.configure(state="disabled")
+
+        # Definir valores padrão
+        self.appearance_mode_optionemenu.set("Dark")
+        self.scaling_optionemenu.set("100%")
+
+        # Cache de conversões compartilhado pela conversão, pelo lote e pela pré-visualização
+        self.cache = CacheConversao()
+        # Versões anteriores gravavam as imagens da pré-visualização nesta pasta, que não é mais usada
+        shutil.rmtree(os.path.join(self.cache.diretorio, "previa"), ignore_errors=True)
+        self.caminho_previa = None
+        self.mtime_previa = None
+        self.previa_em_andamento = False
+        self.previa_pendente = False
+        self.fila_previa = queue.Queue()
+
+    # Evento para abrir um diálogo de entrada
+    def open_input_dialog_event(self):
+        dialog = customtkinter.CTkInputDialog(text="Type in a number:", title="CTkInputDialog")
+        print("CTkInputDialog:", dialog.get_input())
+
+    # Evento para mudar o modo de aparência
+    def change_appearance_mode_event(self, new_appearance_mode: str):
+        customtkinter.set_appearance_mode(new_appearance_mode)
+
+    # Evento para mudar a escala do aplicativo
+    def change_scaling_event(self, new_scaling: str):
+        new_scaling_float = int(new_scaling.replace("%", "")) / 100
+        customtkinter.set_widget_scaling(new_scaling_float)
+
+    # Evento para o botão da barra lateral
+    def sidebar_button_event(self):
+        print("sidebar_button click")
+
+    # Função para ler o arquivo e iniciar a conversão
+    def ler_arquivo(self):
+        tipo_cabecalho = self.optionmenu_1.get()
+        iniciar_conversao(tipo_cabecalho, self.cache)
+
+    def ler_varios_arquivos(self):
+        tipo_cabecalho = self.optionmenu_1.get()
+        iniciar_conversao_em_lote(tipo_cabecalho, self)
+
+    # Função para acompanhar o progresso da conversão em lote sem travar a janela
+    def acompanhar_lote(self, fila_progresso):
+        self.sidebar_button_2.configure(state="disabled")
+        self.progressbar.set(0)
+        self.progress_label.configure(text="Convertendo...")
+        self.after(100, self.verificar_fila_lote, fila_progresso)
+
+    def verificar_fila_lote(self, fila_progresso):
+        try:
+            while True:
+                evento = fila_progresso.get_nowait()
+                if evento[0] == "progresso":
+                    _, resultado, concluidos, total = evento
+                    self.progressbar.set(concluidos / total)
+                    self.progress_label.configure(text=f"{concluidos}/{total} - {os.path.basename(resultado.caminho_docx)}")
+                elif evento[0] == "fim":
+                    self.finalizar_lote(evento[1])
+                    return
+                else:
+                    self.sidebar_button_2.configure(state="normal")
+                    self.progress_label.configure(text="")
+                    messagebox.showerror("Erro", f"Ocorreu um erro: {str(evento[1])}")
+                    return
+        except queue.Empty:
+            pass
+        self.after(100, self.verificar_fila_lote, fila_progresso)
+
+    def finalizar_lote(self, resultados):
+        self.sidebar_button_2.configure(state="normal")
+        falhas = [resultado for resultado in resultados if resultado.erro is not None]
+        self.progress_label.configure(text=f"{len(resultados) - len(falhas)}/{len(resultados)} convertidos")
+        if falhas:
+            detalhes = "\n".join(f"{os.path.basename(falha.caminho_docx)}: {falha.erro}" for falha in falhas)
+            messagebox.showwarning("Conversão em lote", f"{len(falhas)} arquivo(s) não puderam ser convertidos:\n\n{detalhes}")
+        else:
+            messagebox.showinfo("Sucesso", "Conversão em lote realizada com sucesso!")
+
+
+    # Função para escolher o documento a pré-visualizar
+    def pre_visualizar(self):
+        caminho_docx = filedialog.askopenfilename(filetypes=[("Arquivos Word", "*.docx")])
+        if not caminho_docx:
+            return
+        primeira_previa = self.caminho_previa is None
+        self.caminho_previa = caminho_docx
+        self.mtime_previa = None
+        self.atualizar_previa()
+        if primeira_previa:
+            self.after(1000, self.verificar_alteracao_previa)
+
+    # Função para converter o documento da pré-visualização em segundo plano
+    def atualizar_previa(self):
+        # Uma conversão por vez; pedidos feitos durante ela geram uma nova conversão ao final
+        if self.previa_em_andamento:
+            self.previa_pendente = True
+            return
+        self.previa_em_andamento = True
+        self.previa_pendente = False
+        caminho_docx = self.caminho_previa
+        tipo_cabecalho = self.optionmenu_1.get()
+        try:
+            self.mtime_previa = os.stat(caminho_docx).st_mtime_ns
+        except OSError:
+            pass
+
+        def executar_previa():
+            # A pré-visualização só mostra o texto: as imagens não são gravadas, e os caminhos
+            # fixos (dentro do diretório do cache) permitem aproveitar o cache
+            diretorio_previa = os.path.join(self.cache.diretorio, "previa")
+            nome_arquivo = os.path.splitext(os.path.basename(caminho_docx))[0]
+            fluxo = io.StringIO()
+            inicio = time.perf_counter()
+            try:
+                converter_docx_para_markdown(caminho_docx, os.path.join(diretorio_previa, f"{nome_arquivo}.md"),
+                                             os.path.join(diretorio_previa, f"img_{nome_arquivo}"), nome_arquivo, tipo_cabecalho,
+                                             fluxo_saida=fluxo, cache=self.cache, gravar_imagens=False)
+                self.fila_previa.put(("ok", caminho_docx, fluxo.getvalue(), time.perf_counter() - inicio))
+            except Exception as e:
+                self.fila_previa.put(("erro", caminho_docx, str(e), time.perf_counter() - inicio))
+
+        threading.Thread(target=executar_previa, daemon=True).start()
+        self.after(50, self.verificar_fila_previa)
+
+    def verificar_fila_previa(self):
+        try:
+            situacao, caminho_docx, conteudo, duracao = self.fila_previa.get_nowait()
+        except queue.Empty:
+            self.after(50, self.verificar_fila_previa)
+            return
+        self.previa_em_andamento = False
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", "end")
+        if situacao == "ok":
+            self.textbox.insert("1.0", conteudo)
+            self.preview_label.configure(text=f"{os.path.basename(caminho_docx)} ({duracao * 1000:.0f} ms)")
+        else:
+            self.textbox.insert("1.0", f"Ocorreu um erro: {conteudo}")
+            self.preview_label.configure(text=os.path.basename(caminho_docx))
+        self.textbox.configure(state="disabled")
+        if self.previa_pendente:
+            self.atualizar_previa()
+
+    # Função para atualizar a pré-visualização quando o documento é salvo novamente
+    def verificar_alteracao_previa(self):
+        try:
+            mtime = os.stat(self.caminho_previa).st_mtime_ns
+        except OSError:
+            mtime = self.mtime_previa
+        if mtime != self.mtime_previa:
+            self.atualizar_previa()
+        self.after(1000, self.verificar_alteracao_previa)
+
+    # Função para sair do aplicativo
+    def sair(self):
+        self.quit()
+
+    # Função para atualizar a caixa de texto dinâmica com base no tipo de cabeçalho selecionado
+    def update_textbox(self, value):
+        self.dynamic_textbox.configure(state="normal")
+        self.dynamic_textbox.delete("1.0", "end")
+        conteudo_markdown = gerar_cabecalho(value)
+
+        self.dynamic_textbox.insert("1.0", "\n".join(conteudo_markdown))
+        self.dynamic_textbox.configure(state="disabled")
+        if self.caminho_previa is not None:
+            self.atualizar_previa()
+
+# Função para iniciar a interface gráfica
+def main():
+    app = App()
+    app.mainloop()
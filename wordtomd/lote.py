@@ -0,0 +1,259 @@
+import cProfile
+import json
+import os
+import shutil
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from wordtomd import __version__
+from wordtomd.cache import CacheConversao, calcular_hash
+from wordtomd.conversor import converter_docx_para_markdown
+from wordtomd.perfil import Perfil
+
+# Resultado da conversão de um arquivo do lote (erro é None em caso de sucesso;
+# ignorado indica que o arquivo não mudou desde a última conversão incremental;
+# perfil traz os tempos e contadores quando a conversão foi perfilada)
+ResultadoConversao = namedtuple("ResultadoConversao", ["caminho_docx", "caminho_md", "erro", "ignorado", "perfil"], defaults=(False, None))
+
+# Nome do manifesto gravado no diretório de saída pela conversão incremental
+NOME_MANIFESTO = ".wordtomd-manifest.json"
+
+# Prefixo dos arquivos de bloqueio criados pelo Word enquanto um documento está aberto
+PREFIXO_BLOQUEIO = "~$"
+
+# Função para verificar se um nome de arquivo é de um documento DOCX a converter (e não um arquivo de bloqueio do Word).
+def eh_documento(nome_arquivo):
+    return nome_arquivo.endswith(".docx") and not nome_arquivo.startswith(PREFIXO_BLOQUEIO)
+
+# Função para listar os arquivos DOCX de um diretório.
+def listar_docx(diretorio_docx):
+    """
+    Função para listar os arquivos DOCX de um diretório, ignorando os
+    arquivos de bloqueio do Word (~$nome.docx).
+
+    Args:
+        diretorio_docx (str): Diretório contendo arquivos DOCX.
+
+    Returns:
+        list: Caminhos dos arquivos DOCX, em ordem alfabética.
+    """
+    return [
+        os.path.join(diretorio_docx, nome_arquivo)
+        for nome_arquivo in sorted(os.listdir(diretorio_docx))
+        if eh_documento(nome_arquivo)
+    ]
+
+# Função para carregar o manifesto da conversão incremental.
+def carregar_manifesto(diretorio_saida):
+    """
+    Função para carregar o manifesto da conversão incremental.
+
+    Args:
+        diretorio_saida (str): Diretório de saída onde o manifesto é gravado.
+
+    Returns:
+        dict: Entradas do manifesto por nome do arquivo DOCX (vazio se não existir ou estiver corrompido).
+    """
+    try:
+        with open(os.path.join(diretorio_saida, NOME_MANIFESTO), "r", encoding="utf-8") as arquivo_manifesto:
+            entradas = json.load(arquivo_manifesto).get("arquivos", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+    if not isinstance(entradas, dict):
+        return {}
+    # Entradas inválidas são descartadas e os seus documentos, convertidos de novo
+    return {nome_docx: entrada for nome_docx, entrada in entradas.items() if isinstance(entrada, dict)}
+
+# Função para gravar o manifesto da conversão incremental.
+def salvar_manifesto(diretorio_saida, entradas):
+    """
+    Função para gravar o manifesto da conversão incremental de forma atômica.
+
+    Args:
+        diretorio_saida (str): Diretório de saída onde o manifesto é gravado.
+        entradas (dict): Entradas do manifesto por nome do arquivo DOCX.
+    """
+    caminho_manifesto = os.path.join(diretorio_saida, NOME_MANIFESTO)
+    caminho_temporario = caminho_manifesto + ".tmp"
+    with open(caminho_temporario, "w", encoding="utf-8") as arquivo_manifesto:
+        json.dump({"arquivos": entradas}, arquivo_manifesto, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(caminho_temporario, caminho_manifesto)
+
+# Função para remover as saídas de documentos cujo DOCX foi apagado.
+def remover_saidas(diretorio_saida, nome_docx):
+    """
+    Função para remover o .md e a pasta de imagens gerados para um DOCX que não existe mais.
+
+    Args:
+        diretorio_saida (str): Diretório de saída dos arquivos Markdown.
+        nome_docx (str): Nome do arquivo DOCX removido.
+    """
+    nome_arquivo = os.path.splitext(nome_docx)[0]
+    caminho_md = os.path.join(diretorio_saida, f"{nome_arquivo}.md")
+    if os.path.exists(caminho_md):
+        os.remove(caminho_md)
+    shutil.rmtree(os.path.join(diretorio_saida, f"img_{nome_arquivo}"), ignore_errors=True)
+
+# Função para converter um único arquivo do lote, capturando qualquer erro.
+def converter_arquivo(caminho_docx, diretorio_saida, tipo_cabecalho, perfilar=False, diretorio_pstats=None, fluxo_saida=None,
+                      diretorio_cache=None, leitura_preguicosa=False, em_fluxo=False):
+    """
+    Função para converter um único arquivo do lote, capturando qualquer erro.
+    Executada nos processos do pool, por isso fica no nível do módulo.
+
+    Args:
+        caminho_docx (str): Caminho do arquivo DOCX a ser convertido.
+        diretorio_saida (str): Diretório onde o .md e a pasta de imagens serão salvos.
+        tipo_cabecalho (str): Tipo de cabeçalho ("Topico" ou "Sub-Topico").
+        perfilar (bool, opcional): Medir fases, elementos e contadores da conversão.
+        diretorio_pstats (str, opcional): Diretório onde gravar a saída do cProfile
+            da conversão (<nome>.prof, legível com pstats).
+        fluxo_saida (io.TextIOBase, opcional): Fluxo de texto onde escrever o Markdown
+            em vez do arquivo <nome>.md.
+        diretorio_cache (str, opcional): Diretório do cache de conversões (ver
+            wordtomd.cache); sem ele, o cache não é usado.
+        leitura_preguicosa (bool, opcional): Ler o DOCX sem carregar as mídias na memória
+            (ver converter_docx_para_markdown).
+        em_fluxo (bool, opcional): Ler word/document.xml em fluxo, com memória constante
+            (ver converter_docx_para_markdown).
+
+    Returns:
+        ResultadoConversao: Resultado da conversão do arquivo.
+    """
+    nome_arquivo = os.path.splitext(os.path.basename(caminho_docx))[0]
+    caminho_md_saida = os.path.join(diretorio_saida, f"{nome_arquivo}.md")
+    diretorio_imagem = os.path.join(diretorio_saida, f"img_{nome_arquivo}")
+    perfil = Perfil() if perfilar else None
+    perfilador = cProfile.Profile() if diretorio_pstats else None
+    cache = CacheConversao(diretorio_cache) if diretorio_cache else None
+    try:
+        if perfilador is not None:
+            perfilador.enable()
+        try:
+            converter_docx_para_markdown(caminho_docx, caminho_md_saida, diretorio_imagem, nome_arquivo, tipo_cabecalho,
+                                         fluxo_saida=fluxo_saida, perfil=perfil, cache=cache, leitura_preguicosa=leitura_preguicosa,
+                                         em_fluxo=em_fluxo)
+        finally:
+            if perfilador is not None:
+                perfilador.disable()
+                os.makedirs(diretorio_pstats, exist_ok=True)
+                perfilador.dump_stats(os.path.join(diretorio_pstats, f"{nome_arquivo}.prof"))
+    except Exception as e:
+        return ResultadoConversao(caminho_docx, caminho_md_saida, str(e), perfil=perfil)
+    return ResultadoConversao(caminho_docx, caminho_md_saida, None, perfil=perfil)
+
+# Função para converter todos os arquivos DOCX de um diretório em paralelo.
+def converter_em_lote(diretorio_docx, diretorio_saida, tipo_cabecalho, jobs=None, ao_progredir=None, incremental=False,
+                      perfilar=False, diretorio_pstats=None, diretorio_cache=None, leitura_preguicosa=False, em_fluxo=False):
+    """
+    Função para converter todos os arquivos DOCX de um diretório em paralelo.
+    Falhas em um arquivo não interrompem o restante do lote.
+
+    No modo incremental, um manifesto no diretório de saída guarda tamanho,
+    mtime e hash de cada DOCX, além da versão do conversor e do tipo de
+    cabeçalho. Documentos inalterados não são convertidos de novo e as saídas
+    de documentos apagados são removidas. Documentos cuja conversão falhou
+    continuam no manifesto, marcados com "falhou", e são convertidos de novo
+    na próxima execução.
+
+    Args:
+        diretorio_docx (str): Diretório contendo arquivos DOCX.
+        diretorio_saida (str): Diretório de saída dos arquivos Markdown.
+        tipo_cabecalho (str): Tipo de cabeçalho ("Topico" ou "Sub-Topico").
+        jobs (int, opcional): Número de processos. Padrão: número de CPUs.
+        ao_progredir (callable, opcional): Chamada a cada arquivo concluído com
+            (resultado, concluidos, total).
+        incremental (bool, opcional): Pular documentos inalterados usando o manifesto.
+        perfilar (bool, opcional): Incluir em cada resultado o Perfil da conversão.
+        diretorio_pstats (str, opcional): Diretório onde gravar a saída do cProfile
+            de cada documento.
+        diretorio_cache (str, opcional): Diretório do cache de conversões.
+        leitura_preguicosa (bool, opcional): Ler os DOCX sem carregar as mídias na memória.
+        em_fluxo (bool, opcional): Ler o document.xml de cada DOCX em fluxo, com memória constante.
+
+    Returns:
+        list: ResultadoConversao de cada arquivo, na ordem de conclusão.
+    """
+    arquivos = listar_docx(diretorio_docx)
+    total = len(arquivos)
+    os.makedirs(diretorio_saida, exist_ok=True)
+    resultados = []
+
+    def registrar(resultado):
+        resultados.append(resultado)
+        if ao_progredir is not None:
+            ao_progredir(resultado, len(resultados), total)
+
+    # Seleção dos arquivos a converter (todos, fora do modo incremental)
+    pendentes = {}
+    if incremental:
+        manifesto = carregar_manifesto(diretorio_saida)
+        novo_manifesto = {}
+        for caminho_docx in arquivos:
+            nome_docx = os.path.basename(caminho_docx)
+            caminho_md = os.path.join(diretorio_saida, f"{os.path.splitext(nome_docx)[0]}.md")
+            estado = os.stat(caminho_docx)
+            entrada = {"tamanho": estado.st_size, "mtime_ns": estado.st_mtime_ns,
+                       "versao_conversor": __version__, "tipo_cabecalho": tipo_cabecalho}
+            anterior = manifesto.get(nome_docx)
+            mesma_configuracao = (anterior is not None and os.path.exists(caminho_md)
+                                  and not anterior.get("falhou")
+                                  and anterior.get("versao_conversor") == __version__
+                                  and anterior.get("tipo_cabecalho") == tipo_cabecalho)
+            # Tamanho e mtime iguais dispensam a leitura do arquivo; só calculamos o hash se mudaram
+            # (ou se a entrada anterior não tiver o hash)
+            if (mesma_configuracao and anterior.get("sha256") and anterior.get("tamanho") == estado.st_size
+                    and anterior.get("mtime_ns") == estado.st_mtime_ns):
+                entrada["sha256"] = anterior["sha256"]
+            else:
+                entrada["sha256"] = calcular_hash(caminho_docx)
+                if not (mesma_configuracao and anterior.get("sha256") == entrada["sha256"]):
+                    pendentes[caminho_docx] = entrada
+                    continue
+            novo_manifesto[nome_docx] = entrada
+            registrar(ResultadoConversao(caminho_docx, caminho_md, None, True))
+
+        # Remover as saídas de documentos que não existem mais
+        nomes_atuais = {os.path.basename(caminho_docx) for caminho_docx in arquivos}
+        for nome_docx in manifesto:
+            if nome_docx not in nomes_atuais:
+                remover_saidas(diretorio_saida, nome_docx)
+    else:
+        pendentes = dict.fromkeys(arquivos)
+
+    def concluir(resultado):
+        if incremental:
+            entrada = pendentes[resultado.caminho_docx]
+            if resultado.erro is not None:
+                # Arquivos com falha ficam no manifesto, para que suas saídas sejam removidas
+                # se forem apagados, mas marcados para serem tentados novamente
+                entrada = dict(entrada, falhou=True)
+            novo_manifesto[os.path.basename(resultado.caminho_docx)] = entrada
+        registrar(resultado)
+
+    jobs = min(jobs or os.cpu_count() or 1, max(len(pendentes), 1))
+    try:
+        # Com um único processo não vale a pena pagar o custo de criar o pool
+        if jobs == 1:
+            for caminho_docx in pendentes:
+                concluir(converter_arquivo(caminho_docx, diretorio_saida, tipo_cabecalho, perfilar, diretorio_pstats,
+                                           diretorio_cache=diretorio_cache, leitura_preguicosa=leitura_preguicosa, em_fluxo=em_fluxo))
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futuros = {
+                    executor.submit(converter_arquivo, caminho_docx, diretorio_saida, tipo_cabecalho, perfilar, diretorio_pstats,
+                                    diretorio_cache=diretorio_cache, leitura_preguicosa=leitura_preguicosa, em_fluxo=em_fluxo): caminho_docx
+                    for caminho_docx in pendentes
+                }
+                for futuro in as_completed(futuros):
+                    try:
+                        resultado = futuro.result()
+                    except Exception as e:
+                        # Falha do próprio processo (ex.: processo encerrado), não da conversão
+                        caminho_docx = futuros[futuro]
+                        nome_arquivo = os.path.splitext(os.path.basename(caminho_docx))[0]
+                        resultado = ResultadoConversao(caminho_docx, os.path.join(diretorio_saida, f"{nome_arquivo}.md"), str(e))
+                    concluir(resultado)
+    finally:
+        if incremental:
+            salvar_manifesto(diretorio_saida, novo_manifesto)
+    return resultados
@@ -0,0 +1,259 @@
+import logging
+import os
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from wordtomd import __version__
+from wordtomd.cache import calcular_hash
+from wordtomd.lote import carregar_manifesto, converter_arquivo, converter_em_lote, eh_documento, remover_saidas, salvar_manifesto
+
+# Registro das mensagens do modo de observação (configurado por quem chama, ex.: a CLI)
+registro = logging.getLogger("wordtomd.observador")
+
+# Intervalo, em segundos, entre os resumos de vazão e latência
+INTERVALO_RELATORIO = 60.0
+
+# Função executada ao iniciar cada processo do pool: o Ctrl+C é tratado só pelo processo principal
+def ignorar_interrupcao():
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+# Classe que acumula a vazão e a latência das conversões do modo de observação
+class Estatisticas:
+    """
+    Vazão (documentos e bytes de DOCX por segundo) e latência, do salvamento do
+    DOCX até o Markdown pronto, das conversões do modo de observação.
+    """
+    def __init__(self):
+        self.inicio = time.monotonic()
+        self.documentos = 0
+        self.falhas = 0
+        self.bytes_docx = 0
+        self.latencias = []
+
+    # Função para registrar uma conversão concluída
+    def registrar(self, tamanho_docx, latencia, erro=None):
+        if erro is not None:
+            self.falhas += 1
+            return
+        self.documentos += 1
+        self.bytes_docx += tamanho_docx
+        self.latencias.append(latencia)
+
+    # Função para descrever a vazão e a latência acumuladas
+    def resumo(self):
+        duracao = max(time.monotonic() - self.inicio, 1e-9)
+        texto = (f"{self.documentos} documentos em {duracao:.0f}s ({self.documentos / duracao * 60:.1f} doc/min, "
+                 f"{self.bytes_docx / duracao / 1024:.1f} KB/s de DOCX), {self.falhas} falhas")
+        if self.latencias:
+            latencias = sorted(self.latencias)
+            mediana = latencias[len(latencias) // 2]
+            texto += f"; latência salvamento->saída: mediana {mediana:.2f}s, máxima {latencias[-1]:.2f}s"
+        return texto
+
+# Classe que observa um diretório e converte os documentos salvos nele
+class ObservadorDiretorio:
+    """
+    Modo de observação: varre o diretório de entrada a cada intervalo (polling,
+    portátil e sem dependências) e converte os documentos novos ou alterados.
+
+    - Um documento só é convertido depois que seu tamanho e data de modificação
+      ficam iguais por "espera" segundos, de modo que as várias gravações de um
+      único salvamento do Word geram uma única conversão.
+    - Os arquivos de bloqueio do Word (~$nome.docx) são ignorados, e as saídas
+      de um documento só são removidas se ele ficar sumido por "espera" segundos.
+    - As conversões rodam em um pool com no máximo "jobs" processos, e nunca
+      há duas conversões do mesmo documento ao mesmo tempo.
+    - O Markdown e as imagens são gravados em arquivos temporários e trocados
+      com os.replace, de modo que o diretório de saída nunca tem arquivos pela metade.
+    - O manifesto da conversão incremental (wordtomd.lote) é mantido atualizado,
+      então reiniciar o observador não reconverte documentos inalterados.
+
+    Args:
+        diretorio_docx (str): Diretório observado.
+        diretorio_saida (str): Diretório onde os .md e as pastas de imagens são salvos.
+        tipo_cabecalho (str): Tipo de cabeçalho ("Topico" ou "Sub-Topico").
+        intervalo (float, opcional): Segundos entre as varreduras do diretório.
+        espera (float, opcional): Segundos sem alterações antes de converter um documento.
+        jobs (int, opcional): Número máximo de processos de conversão. Padrão: número de CPUs.
+        diretorio_cache (str, opcional): Diretório do cache de conversões.
+        leitura_preguicosa (bool, opcional): Ler os DOCX sem carregar as mídias na memória.
+        em_fluxo (bool, opcional): Ler o document.xml de cada DOCX em fluxo, com memória constante.
+    """
+    def __init__(self, diretorio_docx, diretorio_saida, tipo_cabecalho, intervalo=1.0, espera=2.0, jobs=None,
+                 diretorio_cache=None, leitura_preguicosa=False, em_fluxo=False):
+        self.diretorio_docx = diretorio_docx
+        self.diretorio_saida = diretorio_saida
+        self.tipo_cabecalho = tipo_cabecalho
+        self.intervalo = intervalo
+        self.espera = espera
+        self.jobs = jobs or os.cpu_count() or 1
+        self.opcoes = {"diretorio_cache": diretorio_cache, "leitura_preguicosa": leitura_preguicosa, "em_fluxo": em_fluxo}
+        # Assinatura (tamanho, mtime_ns) da última versão convertida de cada documento
+        self.convertidos = {}
+        # Assinatura e instante (time.monotonic) da última alteração vista dos documentos ainda não convertidos
+        self.alterados = {}
+        # Instante (time.monotonic) em que cada documento convertido deixou de ser visto
+        self.ausentes = {}
+        # Conversões em andamento: futuro -> (nome, assinatura, entrada do manifesto, instante do envio)
+        self.em_andamento = {}
+        self.manifesto = {}
+        self.estatisticas = Estatisticas()
+        self.janela = Estatisticas()
+
+    # Função para sincronizar a saída com o diretório antes de começar a observar
+    def sincronizar(self):
+        """
+        Função para converter, com a conversão incremental em lote, os documentos
+        alterados enquanto o observador estava parado.
+        """
+        os.makedirs(self.diretorio_saida, exist_ok=True)
+        resultados = converter_em_lote(self.diretorio_docx, self.diretorio_saida, self.tipo_cabecalho, jobs=self.jobs,
+                                       incremental=True, **self.opcoes)
+        for resultado in resultados:
+            if resultado.erro is not None:
+                registro.error("Erro ao converter %s: %s", os.path.basename(resultado.caminho_docx), resultado.erro)
+        convertidos = sum(1 for resultado in resultados if resultado.erro is None and not resultado.ignorado)
+        registro.info("Sincronização inicial: %d convertidos, %d inalterados, %d falhas", convertidos,
+                      sum(1 for resultado in resultados if resultado.ignorado), sum(1 for resultado in resultados if resultado.erro is not None))
+        self.manifesto = carregar_manifesto(self.diretorio_saida)
+        # Como no restante da observação, documentos com falha (marcados no manifesto)
+        # só são tentados de novo ao serem salvos outra vez
+        self.convertidos = {nome_docx: (entrada.get("tamanho"), entrada.get("mtime_ns")) for nome_docx, entrada in self.manifesto.items()}
+
+    # Função para varrer o diretório observado
+    def varrer(self):
+        """
+        Função para varrer o diretório observado, atualizando os documentos
+        alterados e removendo as saídas dos documentos apagados.
+
+        Returns:
+            list: Nomes dos documentos estáveis há pelo menos "espera" segundos, prontos para converter.
+        """
+        atuais = {}
+        with os.scandir(self.diretorio_docx) as entradas:
+            for entrada in entradas:
+                if not eh_documento(entrada.name):
+                    continue
+                try:
+                    if entrada.is_file():
+                        estado = entrada.stat()
+                        atuais[entrada.name] = (estado.st_size, estado.st_mtime_ns)
+                except FileNotFoundError:
+                    # Apagado (ou renomeado pelo Word ao salvar) durante a varredura
+                    continue
+
+        agora = time.monotonic()
+        ocupados = {nome for nome, *_ in self.em_andamento.values()}
+        prontos = []
+        for nome, assinatura in atuais.items():
+            if assinatura == self.convertidos.get(nome):
+                self.alterados.pop(nome, None)
+                continue
+            anterior = self.alterados.get(nome)
+            if anterior is None or anterior[0] != assinatura:
+                self.alterados[nome] = (assinatura, agora)
+            elif agora - anterior[1] >= self.espera and nome not in ocupados:
+                prontos.append(nome)
+
+        for nome in list(self.alterados):
+            if nome not in atuais:
+                del self.alterados[nome]
+        for nome in list(self.convertidos):
+            if nome in atuais or nome in ocupados:
+                self.ausentes.pop(nome, None)
+                continue
+            # Ao salvar, o Word troca o arquivo por uma cópia renomeada; só um sumiço
+            # que dura mais que a espera é tratado como remoção
+            if agora - self.ausentes.setdefault(nome, agora) >= self.espera:
+                del self.ausentes[nome]
+                del self.convertidos[nome]
+                self.manifesto.pop(nome, None)
+                remover_saidas(self.diretorio_saida, nome)
+                salvar_manifesto(self.diretorio_saida, self.manifesto)
+                registro.info("Removido: %s", nome)
+        return prontos
+
+    # Função para enviar um documento ao pool de conversão
+    def enviar(self, executor, nome):
+        caminho_docx = os.path.join(self.diretorio_docx, nome)
+        assinatura, _ = self.alterados.pop(nome)
+        try:
+            hash_docx = calcular_hash(caminho_docx)
+        except FileNotFoundError:
+            return
+        entrada = {"tamanho": assinatura[0], "mtime_ns": assinatura[1], "sha256": hash_docx,
+                   "versao_conversor": __version__, "tipo_cabecalho": self.tipo_cabecalho}
+        anterior = self.manifesto.get(nome)
+        caminho_md = os.path.join(self.diretorio_saida, f"{os.path.splitext(nome)[0]}.md")
+        # Salvamentos que não mudam o conteúdo (ex.: só a data) não precisam de conversão
+        if (anterior is not None and not anterior.get("falhou") and os.path.exists(caminho_md)
+                and all(anterior.get(campo) == entrada[campo] for campo in ("sha256", "versao_conversor", "tipo_cabecalho"))):
+            self.registrar_concluido(nome, assinatura, entrada)
+            registro.debug("Inalterado: %s", nome)
+            return
+        futuro = executor.submit(converter_arquivo, caminho_docx, self.diretorio_saida, self.tipo_cabecalho, **self.opcoes)
+        self.em_andamento[futuro] = (nome, assinatura, entrada, time.monotonic())
+
+    # Função para guardar a assinatura e a entrada do manifesto de um documento convertido (ou com falha)
+    def registrar_concluido(self, nome, assinatura, entrada):
+        self.convertidos[nome] = assinatura
+        self.manifesto[nome] = entrada
+        salvar_manifesto(self.diretorio_saida, self.manifesto)
+
+    # Função para tratar as conversões concluídas
+    def coletar(self):
+        for futuro in [futuro for futuro in self.em_andamento if futuro.done()]:
+            nome, assinatura, entrada, envio = self.em_andamento.pop(futuro)
+            try:
+                erro = futuro.result().erro
+            except Exception as e:
+                # Falha do próprio processo (ex.: processo encerrado), não da conversão
+                erro = str(e)
+            # A latência vai do salvamento (mtime do DOCX) até o Markdown pronto
+            latencia = time.time() - assinatura[1] / 1e9
+            if erro is None:
+                self.registrar_concluido(nome, assinatura, entrada)
+                registro.info("Convertido: %s em %.2fs (latência desde o salvamento: %.2fs)", nome, time.monotonic() - envio, latencia)
+            else:
+                # A versão com falha não é tentada de novo até o documento ser salvo outra vez
+                self.registrar_concluido(nome, assinatura, dict(entrada, falhou=True))
+                registro.error("Erro ao converter %s: %s", nome, erro)
+            for estatisticas in (self.estatisticas, self.janela):
+                estatisticas.registrar(assinatura[0], latencia, erro)
+
+    # Função para observar o diretório até ser interrompido
+    def executar(self, parar=None):
+        """
+        Função para observar o diretório até Ctrl+C ou até o evento "parar" ser
+        sinalizado. A vazão e a latência são registradas a cada INTERVALO_RELATORIO
+        segundos (quando houve conversões) e ao final.
+
+        Args:
+            parar (threading.Event, opcional): Evento que encerra a observação.
+        """
+        parar = parar or threading.Event()
+        self.sincronizar()
+        registro.info("Observando %s (intervalo %.1fs, espera %.1fs, %d processos)", self.diretorio_docx, self.intervalo, self.espera, self.jobs)
+        with ProcessPoolExecutor(max_workers=self.jobs, initializer=ignorar_interrupcao) as executor:
+            try:
+                while not parar.is_set():
+                    self.coletar()
+                    for nome in self.varrer():
+                        # Com o pool cheio, os demais documentos esperam a próxima varredura
+                        if len(self.em_andamento) >= self.jobs:
+                            break
+                        self.enviar(executor, nome)
+                    if time.monotonic() - self.janela.inicio >= INTERVALO_RELATORIO:
+                        if self.janela.documentos or self.janela.falhas:
+                            registro.info("Último intervalo: %s", self.janela.resumo())
+                        self.janela = Estatisticas()
+                    parar.wait(self.intervalo)
+            except KeyboardInterrupt:
+                registro.info("Interrompido")
+            # As conversões em andamento terminam antes de sair
+            if self.em_andamento:
+                registro.info("Aguardando %d conversões em andamento", len(self.em_andamento))
+            executor.shutdown(wait=True)
+            self.coletar()
+        registro.info("Total: %s", self.estatisticas.resumo())
@@ -0,0 +1,203 @@
+import mmap
+import posixpath
+import zipfile
+from collections import namedtuple
+from docx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM, RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PackURI
+from docx.oxml.ns import qn
+from docx.oxml.parser import element_class_lookup, oxml_parser
+from lxml import etree
+
+# Namespaces das partes de empacotamento (OPC) do arquivo DOCX
+NS_TIPOS_CONTEUDO = "{http://schemas.openxmlformats.org/package/2006/content-types}"
+NS_RELACOES = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# Tamanho dos blocos de word/document.xml entregues ao analisador na leitura em fluxo
+TAMANHO_BLOCO_XML = 64 * 1024
+
+# Elementos do corpo convertidos na leitura em fluxo
+TAG_CORPO = qn("w:body")
+TAG_PARAGRAFO = qn("w:p")
+TAG_TABELA = qn("w:tbl")
+
+# Parte de imagem do pacote, com os mesmos atributos usados de docx.image.imagepart.ImagePart
+ParteImagem = namedtuple("ParteImagem", ["partname", "content_type"])
+
+# Relação de uma parte do pacote (Relationship de um arquivo .rels)
+Relacao = namedtuple("Relacao", ["reltype", "alvo", "externo"])
+
+# Classe que expõe um arquivo mapeado em memória como um arquivo binário para o zipfile
+class ArquivoMapeado:
+    """
+    Adaptador de um mmap para a interface de arquivo usada pelo zipfile
+    (no Python < 3.13 o mmap não tem seekable()). As páginas do arquivo só
+    são lidas do disco quando acessadas.
+
+    Args:
+        mapa (mmap.mmap): Arquivo mapeado em memória (somente leitura).
+    """
+    def __init__(self, mapa):
+        self.mapa = mapa
+
+    def read(self, tamanho=-1):
+        return self.mapa.read(tamanho)
+
+    def seek(self, posicao, origem=0):
+        self.mapa.seek(posicao, origem)
+        return self.mapa.tell()
+
+    def tell(self):
+        return self.mapa.tell()
+
+    def seekable(self):
+        return True
+
+    def close(self):
+        self.mapa.close()
+
+# Classe que lê um pacote DOCX de forma preguiçosa
+class PacoteDocx:
+    """
+    Leitura preguiçosa de um pacote DOCX. Diferente de docx.Document, que carrega
+    todas as partes do pacote (inclusive vídeos e imagens) na memória, aqui só
+    [Content_Types].xml, as relações, word/document.xml e styles.xml são lidos ao
+    abrir. As imagens continuam no arquivo (mapeado em memória quando possível)
+    até serem exportadas.
+
+    Args:
+        caminho_docx (str): Caminho do arquivo DOCX.
+        carregar_corpo (bool, opcional): Se False, word/document.xml não é analisado
+            ao abrir (elemento_documento fica None) e deve ser lido com iterar_corpo().
+    """
+    def __init__(self, caminho_docx, carregar_corpo=True):
+        self.arquivo = open(caminho_docx, "rb")
+        try:
+            try:
+                fonte = ArquivoMapeado(mmap.mmap(self.arquivo.fileno(), 0, access=mmap.ACCESS_READ))
+            except (OSError, ValueError):
+                # Arquivos vazios ou sistemas de arquivos sem suporte a mmap
+                fonte = self.arquivo
+            self.fonte = fonte
+            self.zip = zipfile.ZipFile(fonte)
+            self.membros = set(self.zip.namelist())
+            self.carregar_tipos_conteudo()
+
+            relacoes_pacote = self.carregar_relacoes(PackURI("/"))
+            self.partname_documento = self.partname_relacionado(PackURI("/"), relacoes_pacote, RT.OFFICE_DOCUMENT)
+            if self.partname_documento is None:
+                raise ValueError("O arquivo não contém um documento do Word (word/document.xml)")
+            self.relacoes = self.carregar_relacoes(self.partname_documento)
+            self.elemento_documento = self.carregar_xml(self.partname_documento) if carregar_corpo else None
+            partname_estilos = self.partname_relacionado(self.partname_documento, self.relacoes, RT.STYLES)
+            self.elemento_estilos = None if partname_estilos is None else self.carregar_xml(partname_estilos)
+        except Exception:
+            self.fechar()
+            raise
+
+    # Função para ler os tipos de conteúdo das partes do pacote
+    def carregar_tipos_conteudo(self):
+        raiz = etree.fromstring(self.zip.read("[Content_Types].xml"))
+        self.tipos_por_extensao = {}
+        self.tipos_por_parte = {}
+        for elemento in raiz:
+            if elemento.tag == f"{NS_TIPOS_CONTEUDO}Default":
+                self.tipos_por_extensao[elemento.get("Extension").lower()] = elemento.get("ContentType")
+            elif elemento.tag == f"{NS_TIPOS_CONTEUDO}Override":
+                self.tipos_por_parte[elemento.get("PartName").lower()] = elemento.get("ContentType")
+
+    # Função para ler as relações de uma parte (vazias se a parte não tiver .rels)
+    def carregar_relacoes(self, partname):
+        membro = partname.rels_uri.membername
+        if membro not in self.membros:
+            return {}
+        relacoes = {}
+        for elemento in etree.fromstring(self.zip.read(membro)).iterchildren(f"{NS_RELACOES}Relationship"):
+            relacoes[elemento.get("Id")] = Relacao(elemento.get("Type"), elemento.get("Target"),
+                                                   elemento.get("TargetMode") == RTM.EXTERNAL)
+        return relacoes
+
+    # Função para obter o nome da primeira parte com uma relação do tipo informado
+    def partname_relacionado(self, partname_origem, relacoes, reltype):
+        for relacao in relacoes.values():
+            if relacao.reltype == reltype and not relacao.externo:
+                return self.resolver_alvo(partname_origem, relacao.alvo)
+        return None
+
+    # Função para resolver o alvo (relativo) de uma relação em um nome de parte
+    def resolver_alvo(self, partname_origem, alvo):
+        if alvo.startswith("/"):
+            return PackURI(posixpath.normpath(alvo))
+        return PackURI.from_rel_ref(partname_origem.baseURI, alvo)
+
+    # Função para carregar uma parte XML com as classes de elemento do python-docx
+    def carregar_xml(self, partname):
+        # O XML é analisado direto do fluxo do zip, sem copiar os bytes da parte
+        with self.zip.open(partname.membername) as fluxo:
+            return etree.parse(fluxo, oxml_parser).getroot()
+
+    # Função para percorrer os parágrafos e tabelas do corpo à medida que document.xml é lido
+    def iterar_corpo(self):
+        """
+        Função para percorrer os filhos w:p e w:tbl de w:body lendo
+        word/document.xml em fluxo. Cada elemento é entregue assim que se fecha
+        (já completo, com as classes de elemento do python-docx) e, depois de
+        processado, é limpo e removido da árvore junto com os irmãos anteriores,
+        de modo que só o elemento atual fica na memória.
+
+        O analisador é um XMLPullParser (a mesma leitura por eventos do
+        etree.iterparse), que permite usar as classes de elemento do python-docx.
+
+        Yields:
+            lxml.etree._Element: Cada parágrafo (CT_P) ou tabela (CT_Tbl) do corpo, em ordem.
+        """
+        analisador = etree.XMLPullParser(events=("end",), tag=(TAG_PARAGRAFO, TAG_TABELA),
+                                          remove_blank_text=True, resolve_entities=False)
+        analisador.set_element_class_lookup(element_class_lookup)
+        with self.zip.open(self.partname_documento.membername) as fluxo:
+            for bloco in iter(lambda: fluxo.read(TAMANHO_BLOCO_XML), b""):
+                analisador.feed(bloco)
+                for _, elemento in analisador.read_events():
+                    corpo = elemento.getparent()
+                    # Parágrafos de tabelas e de controles de conteúdo são tratados com o elemento de cima
+                    if corpo is None or corpo.tag != TAG_CORPO:
+                        continue
+                    yield elemento
+                    elemento.clear()
+                    while elemento.getprevious() is not None:
+                        del corpo[0]
+            analisador.close()
+
+    # Função para obter a parte de imagem apontada por uma relação do documento
+    def parte_imagem(self, rId):
+        """
+        Função para obter a parte de imagem apontada por uma relação do documento.
+
+        Args:
+            rId (str): Identificador da relação (r:embed / r:id).
+
+        Returns:
+            ParteImagem | None: Parte da imagem, ou None se a relação não existir,
+            for externa, não for de imagem ou apontar para uma parte ausente.
+        """
+        relacao = self.relacoes.get(rId)
+        if relacao is None or relacao.externo or "image" not in relacao.reltype:
+            return None
+        partname = self.resolver_alvo(self.partname_documento, relacao.alvo)
+        if partname.membername not in self.membros:
+            return None
+        tipo = self.tipos_por_parte.get(partname.lower()) or self.tipos_por_extensao.get(partname.ext.lower(), "")
+        return ParteImagem(partname, tipo)
+
+    # Função para fechar o pacote e liberar o arquivo
+    def fechar(self):
+        if getattr(self, "zip", None) is not None:
+            self.zip.close()
+        if getattr(self, "fonte", None) is not None and self.fonte is not self.arquivo:
+            self.fonte.close()
+        self.arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
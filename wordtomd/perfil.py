@@ -0,0 +1,143 @@
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+
+# Fases da conversão, na ordem em que acontecem (a escrita ocorre durante o corpo)
+FASES = ["cache", "carregar", "imagens", "corpo", "escrita"]
+
+# Classe que acumula tempos e contadores de uma ou mais conversões
+class Perfil:
+    """
+    Instrumentação opcional da conversão. Acumula o tempo de cada fase
+    (cache, carregar, imagens, corpo, escrita) e de cada tipo de elemento (parágrafos,
+    tabelas, imagens, formatação de links), além de contadores de títulos,
+    links, imagens exportadas e bytes escritos. Quando nenhum Perfil é passado ao conversor, nada é medido.
+
+    Args:
+        ao_evento (callable, opcional): Chamada ao fim de cada fase e de cada
+            elemento medido com (nome, duracao_em_segundos).
+    """
+    def __init__(self, ao_evento=None):
+        self.fases = defaultdict(float)
+        self.elementos = defaultdict(float)
+        self.contagens = Counter()
+        self.ao_evento = ao_evento
+
+    # Função para medir a duração de uma fase
+    @contextmanager
+    def fase(self, nome):
+        inicio = perf_counter()
+        try:
+            yield
+        finally:
+            self.registrar_fase(nome, perf_counter() - inicio)
+
+    # Função para acumular a duração de uma fase
+    def registrar_fase(self, nome, duracao):
+        self.fases[nome] += duracao
+        if self.ao_evento is not None:
+            self.ao_evento(nome, duracao)
+
+    # Função para acumular a duração de um elemento
+    def registrar_elemento(self, nome, duracao):
+        self.elementos[nome] += duracao
+        self.contagens[nome] += 1
+        if self.ao_evento is not None:
+            self.ao_evento(nome, duracao)
+
+    # Função para incrementar um contador
+    def contar(self, nome, quantidade=1):
+        self.contagens[nome] += quantidade
+
+    # Função para envolver uma função, medindo cada chamada como um elemento
+    def cronometrar(self, nome, funcao):
+        """
+        Função para envolver uma função de modo que cada chamada seja medida
+        e contada como um elemento do tipo informado.
+
+        Args:
+            nome (str): Tipo do elemento (ex.: "tabelas").
+            funcao (callable): Função a ser medida.
+
+        Returns:
+            callable: Função com a mesma assinatura, instrumentada.
+        """
+        def funcao_cronometrada(*args, **kwargs):
+            inicio = perf_counter()
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                self.registrar_elemento(nome, perf_counter() - inicio)
+        return funcao_cronometrada
+
+    # Função para somar os tempos e contadores de outro perfil a este
+    def somar(self, outro):
+        for nome, duracao in outro.fases.items():
+            self.fases[nome] += duracao
+        for nome, duracao in outro.elementos.items():
+            self.elementos[nome] += duracao
+        self.contagens.update(outro.contagens)
+
+    # Função para obter os dados do perfil como dicionário (ex.: para gravar em JSON)
+    def como_dict(self):
+        return {"fases": dict(self.fases), "elementos": dict(self.elementos), "contagens": dict(self.contagens)}
+
+    # Função para montar o relatório do perfil em texto
+    def relatorio(self, titulo=None):
+        """
+        Função para montar um relatório legível dos tempos e contadores.
+
+        Args:
+            titulo (str, opcional): Linha inicial do relatório (ex.: nome do documento).
+
+        Returns:
+            str: Relatório com uma linha por fase, por tipo de elemento e por contador.
+        """
+        linhas = [] if titulo is None else [titulo]
+        # A escrita acontece dentro da fase do corpo, por isso não entra no total
+        total = sum(duracao for nome, duracao in self.fases.items() if nome != "escrita")
+        linhas.append("  fases:")
+        for nome in FASES + sorted(set(self.fases) - set(FASES)):
+            if nome in self.fases:
+                observacao = " (dentro de corpo)" if nome == "escrita" else ""
+                linhas.append(f"    {nome:<20} {self.fases[nome]:9.3f}s{observacao}")
+        linhas.append(f"    {'total':<20} {total:9.3f}s")
+        if self.elementos:
+            linhas.append("  elementos:")
+            for nome in sorted(self.elementos):
+                linhas.append(f"    {nome:<20} {self.elementos[nome]:9.3f}s {self.contagens[nome]:>9}x")
+        contadores = sorted(set(self.contagens) - set(self.elementos))
+        if contadores:
+            linhas.append("  contadores:")
+            for nome in contadores:
+                linhas.append(f"    {nome:<20} {self.contagens[nome]:>10}")
+        return "\n".join(linhas)
+
+    # Função para medir as escritas feitas em um fluxo de texto
+    def medir_fluxo(self, fluxo):
+        return FluxoMedido(fluxo, self)
+
+# Classe que repassa as escritas para um fluxo de texto, medindo tempo e bytes
+class FluxoMedido:
+    """
+    Fluxo de texto que repassa as escritas para outro fluxo, acumulando no
+    perfil o tempo gasto (fase "escrita") e os bytes escritos em UTF-8.
+
+    Args:
+        fluxo (io.TextIOBase): Fluxo de texto de destino.
+        perfil (Perfil): Perfil onde os tempos e bytes são acumulados.
+    """
+    def __init__(self, fluxo, perfil):
+        self.fluxo = fluxo
+        self.perfil = perfil
+
+    def write(self, texto):
+        inicio = perf_counter()
+        self.fluxo.write(texto)
+        self.perfil.fases["escrita"] += perf_counter() - inicio
+        self.perfil.contagens["bytes_md"] += len(texto.encode("utf-8"))
+
+    def flush(self):
+        inicio = perf_counter()
+        self.fluxo.flush()
+        self.perfil.fases["escrita"] += perf_counter() - inicio
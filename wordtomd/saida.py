@@ -0,0 +1,80 @@
+import os
+import threading
+from contextlib import contextmanager
+
+# Tamanho do buffer de escrita do arquivo Markdown
+TAMANHO_BUFFER = 1024 * 1024
+
+# Classe que escreve o Markdown de forma incremental em um fluxo de texto
+class SaidaMarkdown:
+    """
+    Destino incremental do Markdown. Cada bloco escrito é separado do anterior
+    por uma quebra de linha, produzindo o mesmo resultado de "\n".join(blocos)
+    sem acumular o documento inteiro na memória.
+
+    Args:
+        fluxo (io.TextIOBase): Fluxo de texto de destino (arquivo, sys.stdout, io.StringIO...).
+    """
+    def __init__(self, fluxo):
+        self.fluxo = fluxo
+        self.primeiro_bloco = True
+
+    # Função para escrever um bloco de Markdown
+    def escrever(self, bloco):
+        if self.primeiro_bloco:
+            self.primeiro_bloco = False
+        else:
+            self.fluxo.write("\n")
+        self.fluxo.write(bloco)
+
+    # Função para escrever vários blocos de Markdown em sequência
+    def escrever_blocos(self, blocos):
+        for bloco in blocos:
+            self.escrever(bloco)
+
+# Função para obter o caminho temporário usado na gravação atômica de um arquivo.
+def caminho_temporario(caminho):
+    """
+    Função para obter o caminho temporário usado na gravação atômica de um
+    arquivo: um arquivo oculto no mesmo diretório (a troca com os.replace só é
+    atômica dentro do mesmo sistema de arquivos), único por processo e thread.
+
+    Args:
+        caminho (str): Caminho final do arquivo.
+
+    Returns:
+        str: Caminho temporário.
+    """
+    diretorio, nome = os.path.split(caminho)
+    return os.path.join(diretorio, f".{nome}.{os.getpid()}-{threading.get_ident()}.tmp")
+
+# Função para abrir o destino do Markdown convertido.
+@contextmanager
+def abrir_saida(caminho_md_saida, fluxo=None):
+    """
+    Função para abrir o destino do Markdown convertido. O arquivo é gravado de
+    forma atômica: se a conversão falhar, o Markdown anterior é mantido.
+
+    Args:
+        caminho_md_saida (str): Caminho do arquivo Markdown (usado quando fluxo é None).
+        fluxo (io.TextIOBase, opcional): Fluxo de texto já aberto, por exemplo
+            sys.stdout ou io.StringIO. Não é fechado ao final.
+
+    Yields:
+        SaidaMarkdown: Destino onde os blocos de Markdown são escritos.
+    """
+    if fluxo is not None:
+        yield SaidaMarkdown(fluxo)
+        fluxo.flush()
+        return
+    # O Markdown é escrito em um arquivo temporário e só substitui o anterior ao final,
+    # de modo que quem lê o diretório de saída nunca vê um arquivo pela metade
+    temporario = caminho_temporario(caminho_md_saida)
+    try:
+        with open(temporario, "w", encoding="utf-8", buffering=TAMANHO_BUFFER) as arquivo_md:
+            yield SaidaMarkdown(arquivo_md)
+        os.replace(temporario, caminho_md_saida)
+    except BaseException:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
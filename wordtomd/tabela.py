@@ -0,0 +1,116 @@
+from docx.oxml.ns import qn
+from wordtomd.texto import ATRIBUTO_VAL
+
+# Tags WordprocessingML usadas na leitura direta das tabelas
+TAG_PARAGRAFO = qn("w:p")
+TAG_TABELA = qn("w:tbl")
+TAG_GRADE = qn("w:tblGrid")
+TAG_COLUNA_GRADE = qn("w:gridCol")
+TAG_LINHA = qn("w:tr")
+TAG_PROPRIEDADES_LINHA = qn("w:trPr")
+TAG_CELULAS_ANTES = qn("w:gridBefore")
+TAG_CELULAS_DEPOIS = qn("w:gridAfter")
+TAG_CELULA = qn("w:tc")
+TAG_PROPRIEDADES_CELULA = qn("w:tcPr")
+TAG_MESCLA_HORIZONTAL = qn("w:gridSpan")
+TAG_MESCLA_VERTICAL = qn("w:vMerge")
+
+# Função para ler um valor inteiro de uma propriedade (ex.: w:gridSpan), com valor padrão.
+def valor_inteiro(elemento, padrao):
+    if elemento is None:
+        return padrao
+    try:
+        return int(elemento.get(ATRIBUTO_VAL))
+    except (TypeError, ValueError):
+        return padrao
+
+# Função para escapar o texto de uma célula de tabela Markdown.
+def escapar_celula(texto):
+    """
+    Função para escapar o texto de uma célula de tabela Markdown: "|" vira "\\|"
+    e quebras de linha viram "<br>", que não encerram a linha da tabela.
+
+    Args:
+        texto (str): Texto da célula.
+
+    Returns:
+        str: Texto seguro para uma célula de tabela Markdown.
+    """
+    return texto.replace("|", "\\|").replace("\n", "<br>")
+
+# Função para montar uma linha de tabela Markdown.
+def linha_markdown(celulas):
+    return "| " + " | ".join(celulas) + " |"
+
+# Função para obter o texto de uma célula, unindo todos os seus parágrafos.
+def texto_celula(elemento_tc, texto_paragrafo):
+    """
+    Função para obter o texto de uma célula, unindo com "<br>" todos os seus
+    parágrafos não vazios (inclusive os de tabelas aninhadas).
+
+    Args:
+        elemento_tc (lxml.etree._Element): Elemento w:tc da célula.
+        texto_paragrafo (callable): Recebe um elemento w:p e retorna seu Markdown.
+
+    Returns:
+        str: Texto da célula, já escapado.
+    """
+    partes = []
+    for filho in elemento_tc:
+        if filho.tag == TAG_PARAGRAFO:
+            paragrafos = (filho,)
+        elif filho.tag == TAG_TABELA:
+            paragrafos = filho.iter(TAG_PARAGRAFO)
+        else:
+            continue
+        for elemento_p in paragrafos:
+            texto = texto_paragrafo(elemento_p).strip()
+            if texto:
+                partes.append(escapar_celula(texto))
+    return "<br>".join(partes)
+
+# Função para obter as linhas de uma tabela, percorrendo w:tr/w:tc uma única vez.
+def linhas_tabela(elemento_tbl, texto_paragrafo):
+    """
+    Função para obter as linhas de uma tabela, percorrendo w:tr e w:tc uma
+    única vez, em tempo linear no tamanho da tabela.
+
+    Células mescladas não são repetidas: uma célula com w:gridSpan ocupa uma
+    coluna com o texto e as demais vazias, e a continuação de uma mescla
+    vertical (w:vMerge) fica vazia. Colunas puladas no início ou no fim da
+    linha (w:gridBefore/w:gridAfter) também viram células vazias, e todas as
+    linhas são completadas até o número de colunas da grade da tabela.
+
+    Args:
+        elemento_tbl (lxml.etree._Element): Elemento w:tbl da tabela.
+        texto_paragrafo (callable): Recebe um elemento w:p e retorna seu Markdown.
+
+    Yields:
+        list: Textos das células de cada linha.
+    """
+    grade = elemento_tbl.find(TAG_GRADE)
+    colunas = 0 if grade is None else sum(1 for _ in grade.iterchildren(TAG_COLUNA_GRADE))
+    for elemento_tr in elemento_tbl.iterchildren(TAG_LINHA):
+        propriedades_linha = elemento_tr.find(TAG_PROPRIEDADES_LINHA)
+        celulas_depois = 0
+        celulas = []
+        if propriedades_linha is not None:
+            celulas.extend([""] * valor_inteiro(propriedades_linha.find(TAG_CELULAS_ANTES), 0))
+            celulas_depois = valor_inteiro(propriedades_linha.find(TAG_CELULAS_DEPOIS), 0)
+        for elemento_tc in elemento_tr.iterchildren(TAG_CELULA):
+            propriedades_celula = elemento_tc.find(TAG_PROPRIEDADES_CELULA)
+            largura = 1
+            continuacao = False
+            if propriedades_celula is not None:
+                largura = max(valor_inteiro(propriedades_celula.find(TAG_MESCLA_HORIZONTAL), 1), 1)
+                mescla_vertical = propriedades_celula.find(TAG_MESCLA_VERTICAL)
+                # w:vMerge sem valor (ou "continue") continua a célula de cima
+                continuacao = mescla_vertical is not None and mescla_vertical.get(ATRIBUTO_VAL, "continue") == "continue"
+            celulas.append("" if continuacao else texto_celula(elemento_tc, texto_paragrafo))
+            celulas.extend([""] * (largura - 1))
+        celulas.extend([""] * celulas_depois)
+        # A primeira linha define o número de colunas quando a tabela não tem grade
+        colunas = colunas or len(celulas)
+        if len(celulas) < colunas:
+            celulas.extend([""] * (colunas - len(celulas)))
+        yield celulas
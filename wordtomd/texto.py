@@ -0,0 +1,180 @@
+from docx.oxml.ns import qn
+from docx.styles import BabelFish
+
+# Tags e atributos WordprocessingML usados na leitura direta do XML
+TAG_RUN = qn("w:r")
+TAG_RPR = qn("w:rPr")
+TAG_T = qn("w:t")
+TAG_BR = qn("w:br")
+TAG_B = qn("w:b")
+TAG_I = qn("w:i")
+TAG_RSTYLE = qn("w:rStyle")
+TAG_ESTILO = qn("w:style")
+TAG_NOME = qn("w:name")
+TAG_BASEADO_EM = qn("w:basedOn")
+ATRIBUTO_VAL = qn("w:val")
+ATRIBUTO_TIPO = qn("w:type")
+ATRIBUTO_ID_ESTILO = qn("w:styleId")
+ATRIBUTO_PADRAO = qn("w:default")
+
+# Texto equivalente dos elementos de conteúdo de um run (o mesmo usado pelo python-docx)
+TEXTO_ELEMENTOS = {qn("w:tab"): "\t", qn("w:ptab"): "\t", qn("w:cr"): "\n", qn("w:noBreakHyphen"): "-"}
+
+# Valores falsos de um atributo ST_OnOff (ausência do atributo equivale a verdadeiro)
+VALORES_FALSOS = {"0", "false", "off"}
+
+# Marcadores Markdown para cada combinação (negrito, itálico)
+MARCADORES = {(True, True): "___", (True, False): "**", (False, True): "_", (False, False): ""}
+
+# Função para ler o valor de uma propriedade liga/desliga (ex.: w:b, w:i).
+def valor_booleano(elemento):
+    return elemento.get(ATRIBUTO_VAL) not in VALORES_FALSOS
+
+# Classe com os estilos do documento pré-processados uma única vez
+class EstilosDocumento:
+    """
+    Cache dos estilos do documento, montado uma única vez a partir de styles.xml.
+    Guarda o nome (como exibido no Word) de cada estilo de parágrafo e o
+    negrito/itálico herdado de cada estilo de caractere.
+
+    Args:
+        elemento_estilos (lxml.etree._Element | None): Elemento w:styles do documento.
+    """
+    def __init__(self, elemento_estilos):
+        self.nomes_paragrafo = {}
+        self.nome_paragrafo_padrao = None
+        propriedades_caractere = {}
+        baseado_em = {}
+
+        estilos = [] if elemento_estilos is None else elemento_estilos.iterchildren(TAG_ESTILO)
+        for estilo in estilos:
+            tipo = estilo.get(ATRIBUTO_TIPO, "paragraph")
+            id_estilo = estilo.get(ATRIBUTO_ID_ESTILO)
+            if tipo == "paragraph":
+                nome = estilo.find(TAG_NOME)
+                nome = None if nome is None else BabelFish.internal2ui(nome.get(ATRIBUTO_VAL))
+                self.nomes_paragrafo[id_estilo] = nome
+                # Assim como no python-docx, vale o último estilo padrão do documento
+                if estilo.get(ATRIBUTO_PADRAO) is not None and estilo.get(ATRIBUTO_PADRAO) not in VALORES_FALSOS:
+                    self.nome_paragrafo_padrao = nome
+            elif tipo == "character":
+                negrito = italico = None
+                rpr = estilo.find(TAG_RPR)
+                if rpr is not None:
+                    b = rpr.find(TAG_B)
+                    i = rpr.find(TAG_I)
+                    negrito = None if b is None else valor_booleano(b)
+                    italico = None if i is None else valor_booleano(i)
+                propriedades_caractere[id_estilo] = (negrito, italico)
+                pai = estilo.find(TAG_BASEADO_EM)
+                if pai is not None:
+                    baseado_em[id_estilo] = pai.get(ATRIBUTO_VAL)
+
+        # Resolver a herança (basedOn) dos estilos de caractere
+        self.formatos_caractere = {}
+        for id_estilo in propriedades_caractere:
+            negrito, italico = propriedades_caractere[id_estilo]
+            visitados = {id_estilo}
+            pai = baseado_em.get(id_estilo)
+            while (negrito is None or italico is None) and pai in propriedades_caractere and pai not in visitados:
+                visitados.add(pai)
+                negrito_pai, italico_pai = propriedades_caractere[pai]
+                negrito = negrito_pai if negrito is None else negrito
+                italico = italico_pai if italico is None else italico
+                pai = baseado_em.get(pai)
+            self.formatos_caractere[id_estilo] = (bool(negrito), bool(italico))
+
+    # Função para obter o nome do estilo de um parágrafo
+    def nome_paragrafo(self, elemento_p):
+        """
+        Função para obter o nome do estilo de um parágrafo, como Paragraph.style.name,
+        sem percorrer os estilos do documento a cada chamada.
+
+        Args:
+            elemento_p (docx.oxml.text.paragraph.CT_P): Elemento w:p do parágrafo.
+
+        Returns:
+            str: Nome do estilo (o estilo padrão se não houver estilo válido aplicado).
+        """
+        id_estilo = elemento_p.style
+        if id_estilo is None or id_estilo not in self.nomes_paragrafo:
+            return self.nome_paragrafo_padrao or ""
+        return self.nomes_paragrafo[id_estilo] or ""
+
+# Função para obter o texto de um parágrafo lendo os runs direto do XML.
+def extrair_texto_paragrafo(elemento_p, estilos):
+    """
+    Função para obter o texto de um parágrafo lendo w:r, w:t, w:b e w:i direto
+    da árvore lxml, mantendo o estilo de negrito e itálico quando aplicado.
+    Runs vizinhos com a mesma formatação são unidos (evita "**a****b**") e
+    negrito/itálico herdados de estilos de caractere são considerados.
+
+    Args:
+        elemento_p (lxml.etree._Element): Elemento w:p do parágrafo.
+        estilos (EstilosDocumento): Estilos pré-processados do documento.
+
+    Returns:
+        str: Texto do parágrafo com estilos de formatação aplicados.
+    """
+    partes = []
+    grupo = []  # Textos do grupo atual de runs com a mesma formatação
+    espacos = []  # Runs só com espaços aguardando o próximo run com texto
+    formato_grupo = None
+
+    def fechar_grupo():
+        if grupo:
+            marcador = MARCADORES[formato_grupo]
+            partes.append(f"{marcador}{''.join(grupo)}{marcador}")
+            grupo.clear()
+
+    for run in elemento_p.iterchildren(TAG_RUN):
+        negrito = italico = estilo_caractere = None
+        textos = []
+        for filho in run:
+            tag = filho.tag
+            if tag == TAG_T:
+                textos.append(filho.text or "")
+            elif tag == TAG_RPR:
+                for propriedade in filho:
+                    if propriedade.tag == TAG_B:
+                        negrito = valor_booleano(propriedade)
+                    elif propriedade.tag == TAG_I:
+                        italico = valor_booleano(propriedade)
+                    elif propriedade.tag == TAG_RSTYLE:
+                        estilo_caractere = propriedade.get(ATRIBUTO_VAL)
+            elif tag == TAG_BR:
+                # Apenas quebras de linha viram "\n"; quebras de página e coluna são ignoradas
+                if filho.get(ATRIBUTO_TIPO, "textWrapping") == "textWrapping":
+                    textos.append("\n")
+            elif tag in TEXTO_ELEMENTOS:
+                textos.append(TEXTO_ELEMENTOS[tag])
+        texto_run = "".join(textos)
+        if not texto_run:
+            continue
+
+        # Runs só com espaços não têm formatação visível: ficam entre grupos ou dentro deles
+        if not texto_run.strip():
+            if grupo:
+                espacos.append(texto_run)
+            else:
+                partes.append(texto_run)
+            continue
+
+        if estilo_caractere is not None and (negrito is None or italico is None):
+            negrito_estilo, italico_estilo = estilos.formatos_caractere.get(estilo_caractere, (False, False))
+            negrito = negrito_estilo if negrito is None else negrito
+            italico = italico_estilo if italico is None else italico
+        formato = (bool(negrito), bool(italico))
+
+        if grupo and formato == formato_grupo:
+            grupo.extend(espacos)
+        else:
+            fechar_grupo()
+            partes.extend(espacos)
+            formato_grupo = formato
+        espacos.clear()
+        grupo.append(texto_run)
+
+    fechar_grupo()
+    partes.extend(espacos)
+    return "".join(partes)